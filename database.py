@@ -142,18 +142,24 @@ def update_conversation_title(conversation_id: int, title: str):
 
 def add_message(conversation_id: int, role: str, content: str):
     """Add a message to a conversation."""
+    add_messages([(conversation_id, role, content)])
+
+
+def add_messages(messages: list[tuple[int, str, str]]):
+    """Add several (conversation_id, role, content) messages in a single transaction."""
     conn = get_connection()
     cursor = conn.cursor()
     p = _placeholder()
+    now = datetime.now()
 
-    cursor.execute(
+    cursor.executemany(
         f"INSERT INTO messages (conversation_id, role, content) VALUES ({p}, {p}, {p})",
-        (conversation_id, role, content)
+        messages
     )
 
-    cursor.execute(
+    cursor.executemany(
         f"UPDATE conversations SET updated_at = {p} WHERE id = {p}",
-        (datetime.now(), conversation_id)
+        [(now, conversation_id) for conversation_id in dict.fromkeys(m[0] for m in messages)]
     )
 
     conn.commit()
@@ -167,7 +173,7 @@ def get_conversation_messages(conversation_id: int) -> list[dict]:
     p = _placeholder()
 
     cursor.execute(
-        f"SELECT role, content, timestamp FROM messages WHERE conversation_id = {p} ORDER BY timestamp",
+        f"SELECT role, content, timestamp FROM messages WHERE conversation_id = {p} ORDER BY timestamp, id",
         (conversation_id,)
     )
 
@@ -7,8 +7,9 @@ from pathlib import Path
 from typing import Generator
 
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import APIConnectionError, APITimeoutError, OpenAI, RateLimitError
 from pinecone import Pinecone
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 # Load environment variables
 load_dotenv()
@@ -16,13 +17,14 @@ load_dotenv()
 # Initialize clients
 openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
-index = pc.Index("legal-docs")
+index = pc.Index("legal-docs", pool_threads=4)  # Threads serving upsert(async_req=True)
 
 # Configuration
 CHUNK_SIZE = 800  # tokens (roughly 4 chars per token)
 CHUNK_OVERLAP = 100  # tokens overlap between chunks
 EMBEDDING_MODEL = "text-embedding-3-small"
 EMBEDDING_DIMENSION = 1024  # Match existing index
+EMBEDDING_BATCH_SIZE = 128  # Texts per embeddings request (~100k tokens at CHUNK_SIZE)
 
 
 def chunk_text(text: str, chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> list[dict]:
@@ -78,6 +80,22 @@ def get_embedding(text: str) -> list[float]:
     return response.data[0].embedding
 
 
+@retry(
+    retry=retry_if_exception_type((RateLimitError, APITimeoutError, APIConnectionError)),
+    wait=wait_exponential(multiplier=1, min=2, max=60),
+    stop=stop_after_attempt(5),
+    reraise=True,
+)
+def get_embeddings_batch(texts: list[str]) -> list[list[float]]:
+    """Get embeddings for many texts in one OpenAI request, in input order"""
+    response = openai_client.embeddings.create(
+        model=EMBEDDING_MODEL,
+        input=texts,
+        dimensions=EMBEDDING_DIMENSION
+    )
+    return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+
 def generate_chunk_id(source: str, episode_title: str, chunk_index: int) -> str:
     """Generate unique ID for a chunk"""
     content = f"{source}:{episode_title}:{chunk_index}"
@@ -5,19 +5,36 @@ with zero Streamlit dependencies. Suitable for use in any Python backend
 (FastAPI, CLI, tests, etc.).
 """
 
+import atexit
 import os
-import json
+import re
+import time
+import asyncio
+import heapq
+import hashlib
+import queue
 import logging
+import sqlite3
 import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 from datetime import datetime, timezone
+from functools import lru_cache
 
 from dotenv import load_dotenv
 from openai import OpenAI
 from anthropic import Anthropic
-from pinecone import Pinecone
+try:
+    # gRPC transport has lower per-query overhead; needs the pinecone[grpc] extra
+    from pinecone.grpc import PineconeGRPC as Pinecone
+except ImportError:
+    from pinecone import Pinecone
 from tenacity import retry, stop_after_attempt, wait_exponential
 import cohere
+import orjson
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -41,25 +58,72 @@ EMBEDDING_DIMENSION = 1024
 CLAUDE_MODEL = "claude-sonnet-4-20250514"
 TOP_K = 25  # Fetch more candidates for reranking
 RERANK_TOP_K = 10  # Keep top 10 after reranking
+RERANK_SKIP_MAX_CANDIDATES = 3  # Too few candidates for reranking to matter
+RERANK_SKIP_SCORE_SPREAD = 0.02  # Candidates this close in score are effectively tied
+RERANK_SKIP_TOP_SCORE = 0.75  # A top Pinecone hit this strong is a confident match...
+RERANK_SKIP_TOP_GAP = 0.05  # ...when the rest of the kept top-K trails it by less than this
+RERANK_MAX_DOC_CHARS = 2048  # ~512 tokens per document sent to Cohere
 MIN_SCORE_THRESHOLD = 0.3  # Drop chunks below this relevance score
+MAX_CONTEXT_TOKENS = 6000  # Token budget for retrieved context in the Claude prompt
 PINECONE_INDEX_NAME = "legal-docs"
+PINECONE_QUERY_WORKERS = 6  # Max concurrent Pinecone queries per search
 
 # ---------------------------------------------------------------------------
 # Retrieval logging
 # ---------------------------------------------------------------------------
 RETRIEVAL_LOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "retrieval_log.jsonl")
-_log_lock = threading.Lock()
+_log_queue: queue.Queue = queue.Queue()
+_log_writer_lock = threading.Lock()
+_log_writer_thread: Optional[threading.Thread] = None
+_log_disabled = False
+_LOG_WRITER_STOP = None  # Queued at exit so the writer flushes and returns
 
 
-def log_retrieval_metrics(metrics: dict):
-    """Append a metrics record to the JSONL retrieval log."""
-    metrics["timestamp"] = datetime.now(timezone.utc).isoformat()
+def _retrieval_log_writer():
+    """Drain the log queue into one long-lived file handle, flushing when idle."""
+    global _log_disabled
     try:
-        with _log_lock:
-            with open(RETRIEVAL_LOG_PATH, "a", encoding="utf-8") as f:
-                f.write(json.dumps(metrics) + "\n")
+        f = open(RETRIEVAL_LOG_PATH, "ab")
     except Exception as e:
-        logger.warning(f"Failed to write retrieval log: {e}")
+        # Stop queueing records nothing will ever write
+        logger.warning(f"Failed to open retrieval log, disabling it: {e}")
+        _log_disabled = True
+        with _log_queue.mutex:
+            _log_queue.queue.clear()
+        return
+    with f:
+        while True:
+            metrics = _log_queue.get()
+            if metrics is _LOG_WRITER_STOP:
+                return
+            try:
+                f.write(orjson.dumps(metrics) + b"\n")
+                if _log_queue.empty():
+                    f.flush()
+            except Exception as e:
+                logger.warning(f"Failed to write retrieval log: {e}")
+
+
+def log_retrieval_metrics(metrics: dict):
+    """Queue a metrics record for the JSONL retrieval log; written off the request thread."""
+    global _log_writer_thread
+    if _log_disabled:
+        return
+    metrics["timestamp"] = datetime.now(timezone.utc).isoformat()
+    if _log_writer_thread is None:
+        with _log_writer_lock:
+            if _log_writer_thread is None:
+                _log_writer_thread = threading.Thread(target=_retrieval_log_writer, daemon=True)
+                _log_writer_thread.start()
+    _log_queue.put_nowait(metrics)
+
+
+@atexit.register
+def _flush_retrieval_log():
+    """Let the writer finish everything still queued when the process exits."""
+    if _log_writer_thread is not None and _log_writer_thread.is_alive():
+        _log_queue.put_nowait(_LOG_WRITER_STOP)
+        _log_writer_thread.join(timeout=5)
 
 
 # ---------------------------------------------------------------------------
@@ -67,8 +131,8 @@ def log_retrieval_metrics(metrics: dict):
 # ---------------------------------------------------------------------------
 MAPPINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "entity_mappings.json")
 try:
-    with open(MAPPINGS_FILE, "r") as f:
-        _mappings = json.load(f)
+    with open(MAPPINGS_FILE, "rb") as f:
+        _mappings = orjson.loads(f.read())
     ENTITY_MAPPINGS = _mappings.get("query_expansion", {})
     SOURCE_KEYWORDS_CONFIG = _mappings.get("source_filters", {})
     logger.info(f"Loaded {len(ENTITY_MAPPINGS)} entity mappings and {len(SOURCE_KEYWORDS_CONFIG)} source filters")
@@ -77,13 +141,40 @@ except FileNotFoundError:
     ENTITY_MAPPINGS = {}
     SOURCE_KEYWORDS_CONFIG = {}
 
+
+def _keyword_pattern(keywords) -> Optional[re.Pattern]:
+    """Compile keywords into a single pattern scanned once per query.
+
+    The lookahead reports overlapping matches; at each position the
+    earliest-listed keyword that starts there wins, so taking the lowest
+    rank across all matches reproduces "first keyword in config order".
+    """
+    if not keywords:
+        return None
+    return re.compile("(?=(" + "|".join(re.escape(k) for k in keywords) + "))")
+
+
+_SOURCE_KEYWORD_RE = _keyword_pattern(SOURCE_KEYWORDS_CONFIG)
+_SOURCE_KEYWORD_RANK = {keyword: i for i, keyword in enumerate(SOURCE_KEYWORDS_CONFIG)}
+
+_ENTITY_RE = _keyword_pattern(ENTITY_MAPPINGS)
+# Entities that can start at the same position as a reported match (one is a
+# prefix of the other); the pattern only reports the earliest-listed of them.
+_ENTITY_PREFIX_PEERS = {
+    entity: [
+        other for other in ENTITY_MAPPINGS
+        if other != entity and (other.startswith(entity) or entity.startswith(other))
+    ]
+    for entity in ENTITY_MAPPINGS
+}
+
 # ---------------------------------------------------------------------------
 # Firm profile
 # ---------------------------------------------------------------------------
 PROFILE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "goff_law_profile.json")
 try:
-    with open(PROFILE_FILE, "r") as f:
-        FIRM_PROFILE = json.load(f)
+    with open(PROFILE_FILE, "rb") as f:
+        FIRM_PROFILE = orjson.loads(f.read())
     logger.info("Loaded firm profile for %s", FIRM_PROFILE.get("firm", {}).get("name", "unknown"))
 except FileNotFoundError:
     logger.warning("Firm profile not found at %s, using empty profile", PROFILE_FILE)
@@ -94,13 +185,87 @@ except FileNotFoundError:
 # ---------------------------------------------------------------------------
 TAKEAWAYS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "takeaways_index.json")
 try:
-    with open(TAKEAWAYS_FILE, "r", encoding="utf-8") as f:
-        TAKEAWAYS_INDEX = json.load(f)
+    with open(TAKEAWAYS_FILE, "rb") as f:
+        TAKEAWAYS_INDEX = orjson.loads(f.read())
     logger.info("Loaded %d episode takeaways", len(TAKEAWAYS_INDEX.get("episodes", {})))
 except FileNotFoundError:
     logger.warning("Takeaways index not found at %s", TAKEAWAYS_FILE)
     TAKEAWAYS_INDEX = {"episodes": {}}
 
+# Pre-lowered, per-field parallel arrays so search_takeaways doesn't redo
+# .get()/.lower() on every episode for every query
+_EP_IDS: list[str] = []
+_EP_RECORDS: list[dict] = []
+_EP_TITLES_LC: list[str] = []
+_EP_SUBJECTS_LC: list[str] = []
+_EP_TOPICS_LC: list[tuple[str, ...]] = []
+_EP_TAKEAWAYS_LC: list[tuple[str, ...]] = []
+_EP_ACTIONS_LC: list[tuple[str, ...]] = []
+_EP_INSIGHTS_LC: list[str] = []
+
+for _episode_id, _ep in TAKEAWAYS_INDEX.get("episodes", {}).items():
+    _insights = _ep.get("unique_insights", "")
+    _EP_IDS.append(_episode_id)
+    _EP_RECORDS.append(_ep)
+    _EP_TITLES_LC.append(_ep.get("title", "").lower())
+    _EP_SUBJECTS_LC.append(_ep.get("subject_area", "").lower())
+    _EP_TOPICS_LC.append(tuple(t.lower() for t in _ep.get("topics", [])))
+    _EP_TAKEAWAYS_LC.append(tuple(t.lower() for t in _ep.get("key_takeaways", [])))
+    _EP_ACTIONS_LC.append(tuple(a.lower() for a in _ep.get("action_items", [])))
+    _EP_INSIGHTS_LC.append(_insights.lower() if isinstance(_insights, str) else "")
+
+
+class _FieldIndex:
+    """All items of one takeaways field concatenated into a single string.
+
+    Substring tests then run as C-level str.find scans over the whole field
+    instead of a Python loop over every item of every episode.
+    """
+
+    _SEP = "\x1e"
+
+    def __init__(self, items):
+        self.episodes: list[int] = []
+        self.starts: list[int] = []
+        parts = []
+        offset = 0
+        for episode_idx, text in items:
+            self.episodes.append(episode_idx)
+            self.starts.append(offset)
+            parts.append(text)
+            offset += len(text) + 1
+        self.corpus = self._SEP.join(parts)
+        self.starts.append(offset)  # sentinel: one past the last item's separator
+
+    def items_containing(self, terms) -> set[int]:
+        """Return indices of items containing at least one of terms."""
+        hits = set()
+        starts = self.starts
+        corpus = self.corpus
+        last_item = len(starts) - 2
+        for term in terms:
+            pos = corpus.find(term)
+            while pos != -1:
+                item = bisect_right(starts, pos) - 1
+                if item > last_item:
+                    break
+                item_end = starts[item + 1] - 1
+                if pos + len(term) <= item_end:
+                    hits.add(item)
+                    pos = corpus.find(term, item_end + 1)
+                else:
+                    # Match straddles a separator, so it isn't inside one item
+                    pos = corpus.find(term, pos + 1)
+        return hits
+
+
+_TITLE_INDEX = _FieldIndex(enumerate(_EP_TITLES_LC))
+_SUBJECT_INDEX = _FieldIndex(enumerate(_EP_SUBJECTS_LC))
+_TOPIC_INDEX = _FieldIndex((i, t) for i, topics in enumerate(_EP_TOPICS_LC) for t in topics)
+_TAKEAWAY_INDEX = _FieldIndex((i, t) for i, takeaways in enumerate(_EP_TAKEAWAYS_LC) for t in takeaways)
+_ACTION_INDEX = _FieldIndex((i, a) for i, actions in enumerate(_EP_ACTIONS_LC) for a in actions)
+_INSIGHT_INDEX = _FieldIndex(enumerate(_EP_INSIGHTS_LC))
+
 # ---------------------------------------------------------------------------
 # Source display names (raw Pinecone source -> human-readable expert name)
 # ---------------------------------------------------------------------------
@@ -148,6 +313,106 @@ SOURCE_DISPLAY_NAMES = {
 }
 
 
+# ---------------------------------------------------------------------------
+# System prompt (built once from the static firm profile)
+# ---------------------------------------------------------------------------
+def _build_system_prompt(profile: dict) -> str:
+    """Render the Super Agent system prompt from the firm profile."""
+    firm = profile.get("firm", {})
+    team = profile.get("team", {})
+    marketing = profile.get("marketing", {})
+    agent_cfg = profile.get("super_agent", {})
+
+    firm_name = firm.get("name", "the firm")
+    firm_size = firm.get("firm_size", "PI firm")
+    location = firm.get("location", "")
+    market = firm.get("market", location)
+    owner = team.get("owner", {})
+    owner_name = owner.get("name", "the owner")
+    owner_focus = owner.get("focus", "")
+    coo = team.get("coo", {})
+    coo_name = coo.get("name", "the COO")
+    coo_focus = coo.get("focus", "")
+    practice_areas = ", ".join(firm.get("practice_areas", []))
+    channels = ", ".join(marketing.get("current_channels", []))
+    priorities = ", ".join(marketing.get("growth_priorities", []))
+    competitive = marketing.get("competitive_landscape", "")
+
+    return f"""You are the SUPER AGENT MARKETING DIRECTOR for {firm_name}, a {firm_size} in {location}.
+
+YOUR FIRM:
+- Owner: {owner_name} — {owner_focus}
+- COO: {coo_name} — {coo_focus}
+- Practice areas: {practice_areas}
+- Current marketing: {channels}
+- Growth priorities: {priorities}
+- Competitive landscape: {competitive}
+
+YOUR KNOWLEDGE BASE:
+You have absorbed hundreds of podcast episodes and articles from the top minds in legal marketing, including:
+- Ken Hardison (PILMMA founder, Grow Your Law Firm podcast)
+- Bob Simon (trial attorney, Bourbon of Proof podcast)
+- John Morgan (Morgan & Morgan, "For the People")
+- Ali Awad (CEO Lawyer)
+- Mike Morse (You Can't Teach Hungry)
+- Trial Lawyer Magazine, PIM Podcast, Attorney at Work, and many more
+
+HOW TO CITE AND SYNTHESIZE:
+- ALWAYS attribute insights to specific experts by name: "Ken Hardison emphasizes..." or "As Bob Simon puts it..."
+- When multiple experts discuss the same topic, compare and synthesize: "Both Morgan and Hardison advocate X, while Morse takes a different approach with Y"
+- Include direct quotes from your knowledge base when they are powerful and relevant
+- Reference specific episodes or sources so {owner_name} and {coo_name} can go deeper if interested
+- When the takeaways intelligence provides action items, present them as tested recommendations from named experts
+
+HOW TO PERSONALIZE FOR {firm_name.upper()}:
+- Frame every recommendation in terms of {firm_name}'s {market} market
+- Acknowledge the competitive reality ({competitive}) and position advice accordingly
+- Consider the firm's current channels ({channels}) and growth priorities when recommending next steps
+- Think about what both {owner_name} (strategic direction) and {coo_name} (execution) need to hear
+
+WHAT YOU CAN DO:
+1. DRAFT content: emails, scripts, marketing plans, intake scripts, ad copy, social media posts
+2. CREATE strategies: full marketing campaigns, referral programs, client nurture sequences
+3. BUILD frameworks: checklists, SOPs, evaluation criteria, decision matrices
+4. ANALYZE situations: review scenarios and provide detailed recommendations
+5. SYNTHESIZE: connect insights across multiple experts into original, actionable guidance
+
+QUALITY STANDARDS:
+- Be specific and actionable — vague advice is worthless
+- When asked to draft, produce COMPLETE, USABLE content, not outlines
+- Connect advice to practical outcomes for a firm of {firm_name}'s size
+- Provide the "why" behind recommendations, not just the "what"
+- If the knowledge base doesn't cover a topic well, say so honestly
+- When experts disagree, present both sides with your recommendation
+
+You are a senior marketing director who knows this firm inside and out. Act like it."""
+
+
+# Module-level so the system prefix is byte-identical across requests,
+# which keeps Anthropic prompt caching effective.
+SYSTEM_PROMPT = _build_system_prompt(FIRM_PROFILE)
+
+_FIRM = FIRM_PROFILE.get("firm", {})
+_FIRM_NAME = _FIRM.get("name", "the firm")
+_FIRM_MARKET = _FIRM.get("market", _FIRM.get("location", ""))
+
+# Static tail of every user turn
+_USER_INSTRUCTIONS = f"""Instructions:
+- ALWAYS cite specific experts by name when their insights are relevant (e.g., "Bob Simon recommends...", "Ken Hardison's approach is...")
+- When multiple experts discuss the same topic, SYNTHESIZE their perspectives — compare, contrast, and recommend
+- Reference specific episodes and quotes when they strengthen your point
+- Tailor all advice to {_FIRM_NAME}'s specific situation in {_FIRM_MARKET}
+- If I'm asking you to DRAFT something, produce complete, usable content
+- If I'm asking a question, provide a comprehensive answer with specific tactics
+- Draw on the conversation history above if relevant
+- Structure longer responses clearly
+- If the context doesn't cover this topic, acknowledge that and provide your best professional reasoning"""
+
+# Sources footer HTML templates
+_SOURCES_FOOTER_TEMPLATE = '\n\n<div class="sources-card"><div class="sources-title">Sources consulted</div>{items}</div>'
+_SOURCE_ITEM_TEMPLATE = '<div class="source-item">{}</div>'
+
+
 # ---------------------------------------------------------------------------
 # Environment validation
 # ---------------------------------------------------------------------------
@@ -166,6 +431,7 @@ def validate_environment() -> bool:
 # Lazy singleton client initialization
 # ---------------------------------------------------------------------------
 _clients = None
+_clients_lock = threading.Lock()
 
 
 def get_clients():
@@ -175,77 +441,324 @@ def get_clients():
     """
     global _clients
     if _clients is None:
-        if not validate_environment():
-            raise RuntimeError("Missing required API keys")
-        openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        anthropic_client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
-        pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
-        index = pc.Index(PINECONE_INDEX_NAME)
-        cohere_client = cohere.ClientV2(api_key=os.getenv("COHERE_API_KEY"))
-        _clients = (openai_client, anthropic_client, index, cohere_client)
-        logger.info("All API clients initialized successfully")
+        with _clients_lock:
+            if _clients is None:
+                if not validate_environment():
+                    raise RuntimeError("Missing required API keys")
+                openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+                anthropic_client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+                pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
+                index = pc.Index(PINECONE_INDEX_NAME)
+                cohere_client = cohere.ClientV2(api_key=os.getenv("COHERE_API_KEY"))
+                _clients = (openai_client, anthropic_client, index, cohere_client)
+                logger.info("All API clients initialized successfully")
     return _clients
 
 
+_warmed = False
+
+
+def warmup():
+    """Initialize clients and prime network connections before the first query.
+
+    Sends a one-token embedding and a Pinecone stats call so the first user
+    request doesn't pay DNS/TLS setup, and bad API keys surface at startup.
+    Safe to call more than once.
+    """
+    global _warmed
+    if _warmed:
+        return
+    openai_client, _, pinecone_index, _ = get_clients()
+    openai_client.embeddings.create(
+        model=EMBEDDING_MODEL,
+        input="ok",
+        dimensions=EMBEDDING_DIMENSION
+    )
+    pinecone_index.describe_index_stats()
+    _warmed = True
+    logger.info("RAG clients warmed up")
+
+
 # ---------------------------------------------------------------------------
-# Embedding (dict cache replaces @st.cache_data)
+# Bounded caches
 # ---------------------------------------------------------------------------
-_embedding_cache: dict[str, list[float]] = {}
+class QueryCache:
+    """Thread-safe LRU cache with an optional per-entry TTL."""
+
+    def __init__(self, max_size: int = 512, ttl_seconds: Optional[float] = None):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key):
+        """Return the cached value for key, or None on a miss or expired entry."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, stored_at = entry
+            if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (value, time.monotonic())
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+
+SEARCH_CACHE_SIZE = 1024
+SEARCH_CACHE_TTL_SECONDS = 300
+EMBEDDING_CACHE_SIZE = 2000
+
+_search_cache = QueryCache(max_size=SEARCH_CACHE_SIZE, ttl_seconds=SEARCH_CACHE_TTL_SECONDS)
+
+
+def _search_cache_key(query: str, source_filter: Optional[tuple[str, ...]], top_k: int) -> bytes:
+    # Case and spacing variants of a question ("What is SEO?" / "what is  seo?") share an entry
+    normalized = " ".join(query.lower().split())
+    return hashlib.blake2b(f"{normalized}|{source_filter!r}|{top_k}".encode("utf-8")).digest()
+
+
+# ---------------------------------------------------------------------------
+# Embedding (RAM LRU + on-disk SQLite cache replaces @st.cache_data)
+# ---------------------------------------------------------------------------
+EMBEDDING_CACHE_PATH = os.getenv(
+    "EMBEDDING_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "embedding_cache.db"),
+)
+
+_embedding_cache = QueryCache(max_size=EMBEDDING_CACHE_SIZE)
+_disk_cache_lock = threading.Lock()
+_disk_cache_conn = None
+
+
+def _embedding_cache_key(text: str) -> str:
+    return hashlib.sha256(f"{EMBEDDING_MODEL}|{EMBEDDING_DIMENSION}|{text}".encode("utf-8")).hexdigest()
+
+
+def _get_disk_cache():
+    """Open the persistent embedding cache on first use. Caller must hold _disk_cache_lock."""
+    global _disk_cache_conn
+    if _disk_cache_conn is None:
+        _disk_cache_conn = sqlite3.connect(EMBEDDING_CACHE_PATH, check_same_thread=False)
+        _disk_cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings_q8 "
+            "(key TEXT PRIMARY KEY, scale REAL NOT NULL, vector BLOB NOT NULL)"
+        )
+        _disk_cache_conn.commit()
+    return _disk_cache_conn
+
+
+def _quantize(vector: list[float]) -> tuple[float, bytes]:
+    """Pack a float vector as int8 with a per-vector scale (4x smaller than float32)."""
+    scale = max(map(abs, vector), default=0.0) / 127 or 1.0
+    return scale, array("b", [round(x / scale) for x in vector]).tobytes()
+
+
+def _dequantize(scale: float, blob: bytes) -> list[float]:
+    return [q * scale for q in array("b", blob)]
+
+
+def _disk_cache_get(keys: list[str]) -> dict[str, list[float]]:
+    """Look up embeddings persisted by previous runs."""
+    if not keys:
+        return {}
+    try:
+        with _disk_cache_lock:
+            conn = _get_disk_cache()
+            placeholders = ",".join("?" * len(keys))
+            rows = conn.execute(
+                f"SELECT key, scale, vector FROM embeddings_q8 WHERE key IN ({placeholders})", keys
+            ).fetchall()
+    except sqlite3.Error as e:
+        logger.warning(f"Embedding disk cache read failed: {e}")
+        return {}
+    return {key: _dequantize(scale, blob) for key, scale, blob in rows}
+
+
+def _disk_cache_put(items: dict[str, list[float]]):
+    """Persist embeddings so restarts don't re-embed known queries."""
+    try:
+        with _disk_cache_lock:
+            conn = _get_disk_cache()
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings_q8 (key, scale, vector) VALUES (?, ?, ?)",
+                [(key, *_quantize(vector)) for key, vector in items.items()],
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        logger.warning(f"Embedding disk cache write failed: {e}")
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10), reraise=True)
 def get_embedding(text: str) -> Optional[list[float]]:
     """Get embedding for text using OpenAI with caching and retry."""
-    if text in _embedding_cache:
-        return _embedding_cache[text]
-    try:
-        openai_client = get_clients()[0]
-        response = openai_client.embeddings.create(
-            model=EMBEDDING_MODEL,
-            input=text,
-            dimensions=EMBEDDING_DIMENSION
-        )
-        embedding = response.data[0].embedding
-        _embedding_cache[text] = embedding
-        return embedding
-    except Exception as e:
-        logger.error(f"Error getting embedding: {e}")
-        raise
+    return get_embeddings([text])[0]
+
+
+def get_embeddings(texts: list[str]) -> list[list[float]]:
+    """Get embeddings for several texts, sending all cache misses in one API call.
+
+    Lookups go RAM LRU -> SQLite disk cache -> OpenAI, and fetched vectors are
+    written back to both tiers. The RAM tier holds the plain lists handed to
+    Pinecone, so a hit costs no conversion; the disk tier stores int8 vectors
+    with a per-vector scale and is dequantized once when loaded. Callers must
+    not mutate the returned lists, which are shared with the cache.
+    """
+    keys = {text: _embedding_cache_key(text) for text in texts}
+    found = {}
+    ram_misses = []
+    for key in dict.fromkeys(keys.values()):
+        embedding = _embedding_cache.get(key)
+        if embedding is None:
+            ram_misses.append(key)
+        else:
+            found[key] = embedding
+
+    for key, embedding in _disk_cache_get(ram_misses).items():
+        _embedding_cache.put(key, embedding)
+        found[key] = embedding
+
+    misses = [text for text, key in keys.items() if key not in found]
+    if misses:
+        try:
+            embeddings = _fetch_embeddings(misses)
+        except Exception as e:
+            logger.error(f"Error getting embeddings: {e}")
+            raise
+        fetched = {keys[text]: embedding for text, embedding in zip(misses, embeddings)}
+        for key, embedding in fetched.items():
+            _embedding_cache.put(key, embedding)
+        _disk_cache_put(fetched)
+        found.update(fetched)
+    return [found[keys[t]] for t in texts]
+
+
+@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10), reraise=True)
+def _fetch_embeddings(texts: list[str]) -> list[list[float]]:
+    """Call the OpenAI embeddings API. Only cache misses go through the retry wrapper."""
+    openai_client = get_clients()[0]
+    response = openai_client.embeddings.create(
+        model=EMBEDDING_MODEL,
+        input=texts,
+        dimensions=EMBEDDING_DIMENSION
+    )
+    return [d.embedding for d in sorted(response.data, key=lambda d: d.index)]
 
 
 # ---------------------------------------------------------------------------
 # Query expansion
 # ---------------------------------------------------------------------------
-def expand_query(query: str) -> list[str]:
-    """Expand query with related terms."""
+@lru_cache(maxsize=1024)
+def expand_query(query: str) -> tuple[str, ...]:
+    """Expand query with related terms. Memoized, so the result is an immutable tuple."""
     queries = [query]
+    if _ENTITY_RE is None:
+        return tuple(queries)
     query_lower = query.lower()
 
+    found = set()
+    for m in _ENTITY_RE.finditer(query_lower):
+        entity = m.group(1)
+        found.add(entity)
+        start = m.start()
+        found.update(peer for peer in _ENTITY_PREFIX_PEERS[entity] if query_lower.startswith(peer, start))
+
     for entity, expansions in ENTITY_MAPPINGS.items():
-        if entity in query_lower:
+        if entity in found:
             for exp in expansions:
                 if exp not in query_lower:
                     queries.append(f"{query} {exp}")
 
-    return queries[:3]
+    return tuple(queries[:3])
 
 
 # ---------------------------------------------------------------------------
 # Reranking
 # ---------------------------------------------------------------------------
-def rerank_results(query: str, matches: list, return_scores: bool = False):
-    """Rerank results using Cohere for better relevance ordering."""
-    if not matches:
-        return (matches, []) if return_scores else matches
+_rerank_inflight: dict[tuple, Future] = {}
+_rerank_inflight_lock = threading.Lock()
+
+
+def _cohere_rerank(query: str, documents: list[str]):
+    """Call Cohere rerank, sharing one request among identical concurrent callers.
+
+    The rerank endpoint takes a single query per call, so concurrent requests
+    can't be batched; duplicates (double-submits, several users asking the
+    same thing) still wait on the leader's response instead of each paying a
+    round trip.
+    """
+    key = (query, tuple(documents))
+    with _rerank_inflight_lock:
+        future = _rerank_inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _rerank_inflight[key] = Future()
+    if not leader:
+        return future.result()
+
     try:
-        cohere_client = get_clients()[3]
-        documents = [m.metadata.get("text", "") for m in matches]
-        response = cohere_client.rerank(
+        response = get_clients()[3].rerank(
             model="rerank-v3.5",
             query=query,
             documents=documents,
             top_n=RERANK_TOP_K,
         )
+    except BaseException as e:
+        # Followers must always be released; an interrupted leader hands them a
+        # plain error so they fall back to score order instead of hanging
+        future.set_exception(e if isinstance(e, Exception) else RuntimeError(f"Rerank aborted: {e!r}"))
+        raise
+    else:
+        future.set_result(response)
+        return response
+    finally:
+        with _rerank_inflight_lock:
+            del _rerank_inflight[key]
+
+
+def _rerank_skip_reason(matches: list) -> Optional[str]:
+    """Return why a Cohere round trip can't meaningfully change these score-sorted matches, if so."""
+    if len(matches) <= RERANK_SKIP_MAX_CANDIDATES:
+        return f"only {len(matches)} candidates"
+    top = matches[0].score
+    if top - matches[-1].score < RERANK_SKIP_SCORE_SPREAD:
+        return f"score spread below {RERANK_SKIP_SCORE_SPREAD}"
+    kth_score = matches[min(RERANK_TOP_K, len(matches)) - 1].score
+    if top >= RERANK_SKIP_TOP_SCORE and top - kth_score < RERANK_SKIP_TOP_GAP:
+        return f"top score {top:.3f} with top-{RERANK_TOP_K} gap below {RERANK_SKIP_TOP_GAP}"
+    return None
+
+
+def rerank_results(query: str, matches: list, return_scores: bool = False):
+    """Rerank results using Cohere for better relevance ordering."""
+    if not matches:
+        return (matches, []) if return_scores else matches
+
+    skip_reason = _rerank_skip_reason(matches)
+    if skip_reason:
+        logger.info(f"Skipping rerank: {skip_reason}")
+        kept = matches[:RERANK_TOP_K]
+        return (kept, [m.score for m in kept]) if return_scores else kept
+
+    try:
+        # Rerank-v3.5 truncates long documents internally; trimming here saves payload and latency
+        documents = [(m.metadata.get("text", "") or "")[:RERANK_MAX_DOC_CHARS] for m in matches]
+        response = _cohere_rerank(query, documents)
         reranked = [matches[r.index] for r in response.results]
         scores = [r.relevance_score for r in response.results]
         logger.info(f"Reranked {len(matches)} chunks down to {len(reranked)}")
@@ -259,100 +772,157 @@ def rerank_results(query: str, matches: list, return_scores: bool = False):
 # ---------------------------------------------------------------------------
 # Source filter detection
 # ---------------------------------------------------------------------------
-def detect_source_filter(query: str) -> list[str] | None:
-    """Detect if the query mentions a known source and return its Pinecone source names."""
-    query_lower = query.lower()
-    for keyword, source_names in SOURCE_KEYWORDS_CONFIG.items():
-        if keyword in query_lower:
-            if isinstance(source_names, str):
-                return [source_names]
-            return source_names
-    return None
+@lru_cache(maxsize=1024)
+def detect_source_filter(query: str) -> tuple[str, ...] | None:
+    """Detect if the query mentions a known source and return its Pinecone source names.
+
+    Memoized, so the names come back as a tuple rather than the shared config list.
+    """
+    if _SOURCE_KEYWORD_RE is None:
+        return None
+    found = {m.group(1) for m in _SOURCE_KEYWORD_RE.finditer(query.lower())}
+    if not found:
+        return None
+    keyword = min(found, key=_SOURCE_KEYWORD_RANK.__getitem__)
+    source_names = SOURCE_KEYWORDS_CONFIG[keyword]
+    if isinstance(source_names, str):
+        return (source_names,)
+    return tuple(source_names)
 
 
 # ---------------------------------------------------------------------------
 # Knowledge-base search
 # ---------------------------------------------------------------------------
-def search_knowledge_base(query: str, top_k: int = TOP_K) -> list[dict]:
-    """Search Pinecone with query expansion, metadata filtering, and deduplication."""
-    pinecone_index = get_clients()[2]
-    queries = expand_query(query)
-    all_matches = {}
-    source_filter = detect_source_filter(query)
+def _query_pinecone(pinecone_index, vectors: list, top_k: int, query_filter: Optional[dict], all_matches: dict) -> bool:
+    """Query Pinecone once per vector, concurrently, keeping the first hit for each id.
 
-    for q in queries:
-        try:
-            query_embedding = get_embedding(q)
-        except Exception as e:
-            logger.warning(f"Failed to get embedding for query after retries: {e}")
-            continue
-
-        try:
-            # Unfiltered search
-            results = pinecone_index.query(
-                vector=query_embedding,
+    Results are merged in query order, so a chunk keeps the score from the
+    original query before any expansion; rerank reorders candidates anyway.
+    Returns False if any query failed, so partial results aren't cached.
+    """
+    if not vectors:
+        return True
+    complete = True
+    # Pinecone queries are independent network calls, so fan them out
+    with ThreadPoolExecutor(max_workers=PINECONE_QUERY_WORKERS) as executor:
+        futures = [
+            executor.submit(
+                pinecone_index.query,
+                vector=vector,
                 top_k=top_k,
-                include_metadata=True
+                include_metadata=True,
+                filter=query_filter,
             )
-
+            for vector in vectors
+        ]
+        for future in futures:
+            try:
+                results = future.result()
+            except Exception as e:
+                logger.error(f"Pinecone query error: {e}")
+                complete = False
+                continue
             for match in results.matches:
-                if match.id not in all_matches or match.score > all_matches[match.id].score:
+                if match.id not in all_matches:
                     all_matches[match.id] = match
+    return complete
 
-            # Source-filtered search if a source was detected
-            if source_filter:
-                filtered_results = pinecone_index.query(
-                    vector=query_embedding,
-                    top_k=top_k,
-                    include_metadata=True,
-                    filter={"source": {"$in": source_filter}}
-                )
-                for match in filtered_results.matches:
-                    if match.id not in all_matches or match.score > all_matches[match.id].score:
-                        all_matches[match.id] = match
 
-        except Exception as e:
-            logger.error(f"Pinecone query error: {e}")
-            continue
+def search_knowledge_base(query: str, top_k: int = TOP_K) -> list[dict]:
+    """Search Pinecone with query expansion, metadata filtering, and deduplication."""
+    source_filter = detect_source_filter(query)
+    cache_key = _search_cache_key(query, source_filter, top_k)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"Search cache hit ({_search_cache.hits} hits, {_search_cache.misses} misses)")
+        # Repeated queries still belong in the retrieval log
+        log_retrieval_metrics({
+            "query": query,
+            "source_filter": source_filter,
+            "top_k": top_k,
+            "cache_hit": True,
+            "after_rerank": len(cached),
+        })
+        return list(cached)
+
+    pinecone_index = get_clients()[2]
+    queries = list(expand_query(query))
+    all_matches = {}
 
-    sorted_matches = sorted(all_matches.values(), key=lambda x: x.score, reverse=True)
+    try:
+        query_embeddings = get_embeddings(queries)
+    except Exception as e:
+        logger.warning(f"Failed to get embeddings for queries after retries: {e}")
+        query_embeddings = []
+
+    if source_filter:
+        # Source detected: the filtered search usually suffices; only fall back
+        # to an unfiltered search when it can't fill the rerank window
+        complete = _query_pinecone(pinecone_index, query_embeddings, top_k, {"source": {"$in": list(source_filter)}}, all_matches)
+        relevant = sum(1 for m in all_matches.values() if m.score >= MIN_SCORE_THRESHOLD)
+        if relevant < RERANK_TOP_K:
+            logger.info(f"Source-filtered search found {relevant} relevant chunks, adding unfiltered search")
+            complete &= _query_pinecone(pinecone_index, query_embeddings, top_k, None, all_matches)
+    else:
+        complete = _query_pinecone(pinecone_index, query_embeddings, top_k, None, all_matches)
+
+    # Only the top_k candidates go on to reranking, so skip the full sort
+    sorted_matches = heapq.nlargest(top_k, all_matches.values(), key=lambda x: x.score)
 
     # Capture pre-filter metrics
-    pinecone_total = len(sorted_matches)
+    pinecone_total = len(all_matches)
     pinecone_score_range = (
-        (round(sorted_matches[-1].score, 4), round(sorted_matches[0].score, 4))
+        (round(min(m.score for m in all_matches.values()), 4), round(sorted_matches[0].score, 4))
         if sorted_matches else (None, None)
     )
+    after_threshold = sum(1 for m in all_matches.values() if m.score >= MIN_SCORE_THRESHOLD)
 
     # Filter out low-relevance chunks
     sorted_matches = [m for m in sorted_matches if m.score >= MIN_SCORE_THRESHOLD]
-    after_threshold = len(sorted_matches)
 
     # Rerank for better relevance ordering
-    reranked, cohere_scores = rerank_results(query, sorted_matches[:top_k], return_scores=True)
+    skipped_rerank = bool(sorted_matches) and _rerank_skip_reason(sorted_matches) is not None
+    reranked, cohere_scores = rerank_results(query, sorted_matches, return_scores=True)
     cohere_score_range = (
         (round(min(cohere_scores), 4), round(max(cohere_scores), 4))
-        if cohere_scores else (None, None)
+        if cohere_scores and not skipped_rerank else (None, None)
     )
 
     # Log retrieval metrics
     log_retrieval_metrics({
         "query": query,
         "source_filter": source_filter,
+        "top_k": top_k,
+        "cache_hit": False,
         "num_expanded_queries": len(queries),
         "pinecone_results_total": pinecone_total,
         "pinecone_score_min": pinecone_score_range[0],
         "pinecone_score_max": pinecone_score_range[1],
         "after_threshold_filter": after_threshold,
         "threshold": MIN_SCORE_THRESHOLD,
+        "skipped_rerank": skipped_rerank,
         "after_rerank": len(reranked),
         "cohere_score_min": cohere_score_range[0],
         "cohere_score_max": cohere_score_range[1],
     })
 
+    # Only cache full-quality answers: an empty result, a failed Pinecone query or a
+    # Cohere failure (no scores despite candidates) would otherwise pin a degraded answer
+    rerank_failed = bool(sorted_matches) and not cohere_scores
+    if reranked and complete and not rerank_failed:
+        _search_cache.put(cache_key, list(reranked))
     return reranked
 
 
+async def asearch_knowledge_base(query: str, top_k: int = TOP_K) -> list[dict]:
+    """Async variant of search_knowledge_base for asyncio callers.
+
+    Runs the pipeline on a worker thread so the event loop isn't blocked; the
+    Pinecone fan-out inside it already overlaps its network calls.
+    """
+    return await asyncio.to_thread(search_knowledge_base, query, top_k)
+
+
 # ---------------------------------------------------------------------------
 # Takeaways search
 # ---------------------------------------------------------------------------
@@ -361,90 +931,75 @@ def search_takeaways(query: str, limit: int = 5) -> list[dict]:
     takeaways, action items, unique insights, and notable quotes."""
     query_lower = query.lower()
     query_words = {w for w in query_lower.split() if len(w) > 3}
-    results = []
-
-    for episode_id, ep in TAKEAWAYS_INDEX.get("episodes", {}).items():
-        score = 0
+    scores = defaultdict(int)
 
-        # Full phrase match in title (highest weight)
-        if query_lower in ep.get("title", "").lower():
-            score += 5
+    def add(index: _FieldIndex, items, points: int):
+        episodes = index.episodes
+        for item in items:
+            scores[episodes[item]] += points
 
-        # Subject area match
-        if query_lower in ep.get("subject_area", "").lower():
-            score += 4
+    # Full phrase match in title (highest weight)
+    add(_TITLE_INDEX, _TITLE_INDEX.items_containing([query_lower]), 5)
 
-        # Topic matches
-        for topic in ep.get("topics", []):
-            topic_lower = topic.lower()
-            if query_lower in topic_lower:
-                score += 3
-            elif any(w in topic_lower for w in query_words):
-                score += 1
+    # Subject area match
+    add(_SUBJECT_INDEX, _SUBJECT_INDEX.items_containing([query_lower]), 4)
 
-        # Takeaway content matches
-        for takeaway in ep.get("key_takeaways", []):
-            if any(w in takeaway.lower() for w in query_words):
-                score += 1
+    # Topic matches: phrase beats individual words
+    topic_phrase = _TOPIC_INDEX.items_containing([query_lower])
+    add(_TOPIC_INDEX, topic_phrase, 3)
+    add(_TOPIC_INDEX, _TOPIC_INDEX.items_containing(query_words) - topic_phrase, 1)
 
-        # Action item matches
-        for action in ep.get("action_items", []):
-            if any(w in action.lower() for w in query_words):
-                score += 1
+    # Takeaway content, action item, and unique insight matches
+    for index in (_TAKEAWAY_INDEX, _ACTION_INDEX, _INSIGHT_INDEX):
+        add(index, index.items_containing(query_words), 1)
 
-        # Unique insights match
-        insights = ep.get("unique_insights", "")
-        if isinstance(insights, str) and any(w in insights.lower() for w in query_words):
-            score += 1
-
-        if score > 0:
-            results.append({"episode_id": episode_id, "score": score, **ep})
-
-    results.sort(key=lambda x: x["score"], reverse=True)
-    return results[:limit]
+    # Ties keep index order, matching a stable sort over all episodes
+    top = heapq.nlargest(limit, sorted(scores), key=scores.__getitem__)
+    return [{"episode_id": _EP_IDS[i], "score": scores[i], **_EP_RECORDS[i]} for i in top]
 
 
 # ---------------------------------------------------------------------------
 # Prompt builder
 # ---------------------------------------------------------------------------
-def build_prompt(query: str, context_chunks: list[dict], conversation_history: list[dict]) -> tuple:
-    """Build the prompt components for Claude. Returns (system_prompt, messages, sources_text)."""
+def estimate_tokens(text: str) -> int:
+    """Approximate token count (rough estimate: 1 token ≈ 0.75 words)."""
+    return len(text.split()) * 4 // 3
 
-    # --- Extract firm profile data ---
-    firm = FIRM_PROFILE.get("firm", {})
-    team = FIRM_PROFILE.get("team", {})
-    marketing = FIRM_PROFILE.get("marketing", {})
-    agent_cfg = FIRM_PROFILE.get("super_agent", {})
 
-    firm_name = firm.get("name", "the firm")
-    firm_size = firm.get("firm_size", "PI firm")
-    location = firm.get("location", "")
-    market = firm.get("market", location)
-    owner = team.get("owner", {})
-    owner_name = owner.get("name", "the owner")
-    owner_focus = owner.get("focus", "")
-    coo = team.get("coo", {})
-    coo_name = coo.get("name", "the COO")
-    coo_focus = coo.get("focus", "")
-    practice_areas = ", ".join(firm.get("practice_areas", []))
-    channels = ", ".join(marketing.get("current_channels", []))
-    priorities = ", ".join(marketing.get("growth_priorities", []))
-    competitive = marketing.get("competitive_landscape", "")
+def build_prompt(query: str, context_chunks: list[dict], conversation_history: list[dict]) -> tuple:
+    """Build the prompt components for Claude. Returns (system_prompt, messages, sources_text)."""
 
     # --- Build context from chunks with display names ---
-    context_parts = []
+    packed = []
     sources = set()
+    context_tokens = 0
+
+    display_name = SOURCE_DISPLAY_NAMES.get
 
-    for i, match in enumerate(context_chunks, 1):
-        metadata = match.metadata
-        source = metadata.get("source", "Unknown")
-        episode = metadata.get("episode_title", "Unknown")
-        text = metadata.get("text", "")
-        display_source = SOURCE_DISPLAY_NAMES.get(source, source)
+    # Chunks arrive in relevance order; pack them until the token budget is spent
+    for match in context_chunks:
+        meta_get = match.metadata.get
+        source = meta_get("source", "Unknown")
+        episode = meta_get("episode_title", "Unknown")
+        text = meta_get("text", "")
+        display_source = display_name(source, source)
 
-        context_parts.append(f"[Source {i}: {display_source} - \"{episode}\"]\n{text}")
+        chunk_tokens = estimate_tokens(f"{display_source} {episode}\n{text}")
+        if packed and context_tokens + chunk_tokens > MAX_CONTEXT_TOKENS:
+            logger.info(f"Context budget reached, using {len(packed)} of {len(context_chunks)} chunks")
+            break
+        context_tokens += chunk_tokens
+
+        packed.append((match.id, display_source, episode, text))
         sources.add(f"{display_source}: {episode}")
 
+    # Emit in chunk-id order so overlapping retrievals yield identical,
+    # cacheable prompt prefixes regardless of score jitter
+    packed.sort(key=lambda p: p[0])
+    context_parts = [
+        f"[Source {i}: {display_source} - \"{episode}\"]\n{text}"
+        for i, (_, display_source, episode, text) in enumerate(packed, 1)
+    ]
     context = "\n\n---\n\n".join(context_parts)
 
     # --- Search takeaways ---
@@ -455,7 +1010,7 @@ def build_prompt(query: str, context_chunks: list[dict], conversation_history: l
         takeaway_parts = []
         for t in takeaway_matches:
             raw_source = t.get("source", "")
-            display_source = SOURCE_DISPLAY_NAMES.get(raw_source, raw_source)
+            display_source = display_name(raw_source, raw_source)
             parts = [f"[{display_source} - \"{t.get('title', 'Unknown')}\"]"]
             parts.append(f"  Subject: {t.get('subject_area', 'N/A')}")
             parts.append("  Key Takeaways:")
@@ -476,56 +1031,6 @@ def build_prompt(query: str, context_chunks: list[dict], conversation_history: l
 
         takeaways_context = "\n\n---\n\n".join(takeaway_parts)
 
-    # --- System prompt ---
-    system_prompt = f"""You are the SUPER AGENT MARKETING DIRECTOR for {firm_name}, a {firm_size} in {location}.
-
-YOUR FIRM:
-- Owner: {owner_name} — {owner_focus}
-- COO: {coo_name} — {coo_focus}
-- Practice areas: {practice_areas}
-- Current marketing: {channels}
-- Growth priorities: {priorities}
-- Competitive landscape: {competitive}
-
-YOUR KNOWLEDGE BASE:
-You have absorbed hundreds of podcast episodes and articles from the top minds in legal marketing, including:
-- Ken Hardison (PILMMA founder, Grow Your Law Firm podcast)
-- Bob Simon (trial attorney, Bourbon of Proof podcast)
-- John Morgan (Morgan & Morgan, "For the People")
-- Ali Awad (CEO Lawyer)
-- Mike Morse (You Can't Teach Hungry)
-- Trial Lawyer Magazine, PIM Podcast, Attorney at Work, and many more
-
-HOW TO CITE AND SYNTHESIZE:
-- ALWAYS attribute insights to specific experts by name: "Ken Hardison emphasizes..." or "As Bob Simon puts it..."
-- When multiple experts discuss the same topic, compare and synthesize: "Both Morgan and Hardison advocate X, while Morse takes a different approach with Y"
-- Include direct quotes from your knowledge base when they are powerful and relevant
-- Reference specific episodes or sources so {owner_name} and {coo_name} can go deeper if interested
-- When the takeaways intelligence provides action items, present them as tested recommendations from named experts
-
-HOW TO PERSONALIZE FOR {firm_name.upper()}:
-- Frame every recommendation in terms of {firm_name}'s {market} market
-- Acknowledge the competitive reality ({competitive}) and position advice accordingly
-- Consider the firm's current channels ({channels}) and growth priorities when recommending next steps
-- Think about what both {owner_name} (strategic direction) and {coo_name} (execution) need to hear
-
-WHAT YOU CAN DO:
-1. DRAFT content: emails, scripts, marketing plans, intake scripts, ad copy, social media posts
-2. CREATE strategies: full marketing campaigns, referral programs, client nurture sequences
-3. BUILD frameworks: checklists, SOPs, evaluation criteria, decision matrices
-4. ANALYZE situations: review scenarios and provide detailed recommendations
-5. SYNTHESIZE: connect insights across multiple experts into original, actionable guidance
-
-QUALITY STANDARDS:
-- Be specific and actionable — vague advice is worthless
-- When asked to draft, produce COMPLETE, USABLE content, not outlines
-- Connect advice to practical outcomes for a firm of {firm_name}'s size
-- Provide the "why" behind recommendations, not just the "what"
-- If the knowledge base doesn't cover a topic well, say so honestly
-- When experts disagree, present both sides with your recommendation
-
-You are a senior marketing director who knows this firm inside and out. Act like it."""
-
     # --- Build messages with conversation history ---
     messages = []
 
@@ -536,35 +1041,30 @@ You are a senior marketing director who knows this firm inside and out. Act like
     # --- User message with both context layers ---
     takeaways_block = ""
     if takeaways_context:
-        takeaways_block = f"""
+        takeaways_block = f"""Pre-Extracted Episode Intelligence ({len(takeaway_matches)} relevant episodes):
+{takeaways_context}
 
-Pre-Extracted Episode Intelligence ({len(takeaway_matches)} relevant episodes):
-{takeaways_context}"""
+"""
 
-    user_message = f"""Current Question: {query}
+    # Retrieved context goes first with a cache breakpoint; the per-turn
+    # question and instructions follow so they don't invalidate the cache
+    context_block = f"""Retrieved Knowledge Base Context ({len(context_parts)} most relevant excerpts):
+{context}"""
 
-Retrieved Knowledge Base Context ({len(context_chunks)} most relevant excerpts):
-{context}{takeaways_block}
+    question_block = f"""{takeaways_block}Current Question: {query}
 
-Instructions:
-- ALWAYS cite specific experts by name when their insights are relevant (e.g., "Bob Simon recommends...", "Ken Hardison's approach is...")
-- When multiple experts discuss the same topic, SYNTHESIZE their perspectives — compare, contrast, and recommend
-- Reference specific episodes and quotes when they strengthen your point
-- Tailor all advice to {firm_name}'s specific situation in {market}
-- If I'm asking you to DRAFT something, produce complete, usable content
-- If I'm asking a question, provide a comprehensive answer with specific tactics
-- Draw on the conversation history above if relevant
-- Structure longer responses clearly
-- If the context doesn't cover this topic, acknowledge that and provide your best professional reasoning"""
+{_USER_INSTRUCTIONS}"""
 
-    messages.append({"role": "user", "content": user_message})
+    messages.append({"role": "user", "content": [
+        {"type": "text", "text": context_block, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": question_block},
+    ]})
 
     # --- Build sources footer ---
     sources_list = sorted(sources)[:5]
-    sources_items = "".join(f'<div class="source-item">{s}</div>' for s in sources_list)
-    sources_text = f'\n\n<div class="sources-card"><div class="sources-title">Sources consulted</div>{sources_items}</div>'
+    sources_text = _SOURCES_FOOTER_TEMPLATE.format(items="".join(map(_SOURCE_ITEM_TEMPLATE.format, sources_list)))
 
-    return system_prompt, messages, sources_text
+    return SYSTEM_PROMPT, messages, sources_text
 
 
 # ---------------------------------------------------------------------------
@@ -576,7 +1076,7 @@ def stream_response(system_prompt: str, messages: list[dict]):
     with anthropic_client.messages.stream(
         model=CLAUDE_MODEL,
         max_tokens=4096,
-        system=system_prompt,
+        system=[{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}],
         messages=messages
     ) as stream:
         for text in stream.text_stream:
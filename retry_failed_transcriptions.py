@@ -2,93 +2,199 @@
 
 import json
 import os
+import re
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, Optional, Tuple
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent / ".env")
 
-from openai import OpenAI
+import httpx
+import orjson
+from openai import APIConnectionError, APITimeoutError, InternalServerError, OpenAI, RateLimitError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+try:
+    # Optional: local CTranslate2 Whisper; without it every file goes through the API
+    from faster_whisper import BatchedInferencePipeline, WhisperModel
+except ImportError:
+    WhisperModel = None
 
 # Configuration
 MAX_FILE_SIZE_BYTES = 24 * 1024 * 1024  # 24MB (OpenAI limit is 25MB)
-CHUNK_DURATION_SECONDS = 600  # 10 minutes chunks for more reliable uploads
+CHUNK_DURATION_SECONDS = 1500  # 25 minute chunks (~4.5MB at 24kbps Opus)
+MAX_CONCURRENCY = 8  # Whisper uploads in flight at once
+OPENAI_RPM = 50  # Whisper requests per minute allowed for the account
+MAX_RETRY_AFTER_SECONDS = 60  # Cap on how long a server Retry-After can stall a worker
+EPISODE_NUMBER_RE = re.compile(r'Ep\.?\s*(\d+)', re.IGNORECASE)
+LOCAL_WHISPER_MODEL = "large-v3"
+LOCAL_WHISPER_DEVICE = os.environ.get("WHISPER_DEVICE", "cuda")
+LOCAL_WHISPER_COMPUTE_TYPE = "int8_float16" if LOCAL_WHISPER_DEVICE == "cuda" else "int8"
+LOCAL_WHISPER_BATCH_SIZE = 16  # 30-second windows decoded per forward pass
+
+
+class TokenBucket:
+    """Thread-safe token bucket: acquire() blocks until a token is available"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Shared by every thread so concurrent chunks stay under the account's RPM
+whisper_bucket = TokenBucket(rate=OPENAI_RPM / 60, capacity=max(1.0, OPENAI_RPM / 60))
+_whisper_slots = threading.Semaphore(MAX_CONCURRENCY)
+_backoff = wait_exponential(multiplier=1, min=2, max=60)
+
+
+def wait_retry_after(retry_state) -> float:
+    """Honor the server's Retry-After header when present, else back off exponentially"""
+    response = getattr(retry_state.outcome.exception(), "response", None)
+    if response is not None:
+        try:
+            return min(float(response.headers.get("retry-after")), MAX_RETRY_AFTER_SECONDS)
+        except (TypeError, ValueError):
+            pass
+    return _backoff(retry_state)
+
+
+# ffprobe results keyed by path + mtime + size, persisted between runs
+DURATION_CACHE_NAME = ".ffprobe_cache.json"
+_duration_cache = {}
+
+
+def load_duration_cache(cache_path: Path):
+    """Load durations probed by previous runs"""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            _duration_cache.update(json.load(f))
+    except (OSError, ValueError):
+        pass
+
+
+def save_duration_cache(cache_path: Path):
+    """Persist probed durations for the next run"""
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(_duration_cache, f)
+    except OSError as e:
+        print(f"Could not save duration cache: {e}")
 
 
 def get_audio_duration(audio_path: Path) -> Optional[float]:
-    """Get duration of audio file in seconds using ffprobe"""
+    """Get duration of audio file in seconds using ffprobe (cached per file version)"""
     try:
+        stat = audio_path.stat()
+        key = f"{audio_path}|{stat.st_mtime_ns}|{stat.st_size}"
+        if key in _duration_cache:
+            return _duration_cache[key]
+
         result = subprocess.run(
             [
                 "ffprobe", "-v", "error",
                 "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1",
+                "-print_format", "json",
                 str(audio_path)
             ],
             capture_output=True,
             text=True
         )
         if result.returncode == 0:
-            return float(result.stdout.strip())
+            duration = float(json.loads(result.stdout)["format"]["duration"])
+            _duration_cache[key] = duration
+            return duration
     except Exception as e:
         print(f"  Error getting duration: {e}")
     return None
 
 
-def split_audio_to_chunks(audio_path: Path, temp_dir: Path) -> List[Path]:
-    """Split audio file into chunks"""
+def iter_audio_chunks(audio_path: Path, temp_dir: Path) -> Iterator[Path]:
+    """Split audio into chunks in one ffmpeg segment pass, yielding each chunk as soon as it's closed"""
     duration = get_audio_duration(audio_path)
     if not duration:
         print(f"  Could not determine audio duration")
-        return []
-
-    chunks = []
-    chunk_num = 0
-    start_time = 0
+        return
 
     num_chunks = int(duration // CHUNK_DURATION_SECONDS) + (1 if duration % CHUNK_DURATION_SECONDS > 0 else 0)
     print(f"  Splitting {duration/60:.1f} min audio into {num_chunks} chunks...")
 
-    while start_time < duration:
-        chunk_path = temp_dir / f"chunk_{chunk_num}.mp3"
+    # Leftovers from a previous file would otherwise be mistaken for this file's chunks
+    for stale in temp_dir.glob("chunk_*.ogg"):
+        stale.unlink()
 
-        result = subprocess.run(
+    # The segment list on stdout names each chunk once ffmpeg has finished writing it;
+    # stderr goes to a file so a chatty encode can't fill the pipe and stall ffmpeg
+    with tempfile.TemporaryFile(mode="w+") as stderr:
+        process = subprocess.Popen(
             [
                 "ffmpeg", "-y",
                 "-i", str(audio_path),
-                "-ss", str(start_time),
-                "-t", str(CHUNK_DURATION_SECONDS),
+                "-vn",  # Skip any embedded artwork/video stream
+                "-f", "segment",
+                "-segment_time", str(CHUNK_DURATION_SECONDS),
+                "-segment_list", "pipe:1",
+                "-segment_list_type", "flat",
+                "-reset_timestamps", "1",
+                "-c:a", "libopus",
+                "-b:a", "24k",  # Voice-tuned Opus is ~3x smaller than 64kbps MP3
+                "-vbr", "on",
+                "-application", "voip",
                 "-ac", "1",  # Mono
-                "-ab", "64k",  # 64kbps
                 "-ar", "16000",  # 16kHz (Whisper's native rate)
-                str(chunk_path)
+                str(temp_dir / "chunk_%03d.ogg")
             ],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
             text=True
         )
 
-        if result.returncode == 0 and chunk_path.exists():
-            size_mb = chunk_path.stat().st_size / (1024 * 1024)
-            print(f"    Chunk {chunk_num}: {size_mb:.1f}MB")
-            chunks.append(chunk_path)
-        else:
-            print(f"    Failed to create chunk {chunk_num}: {result.stderr[:200]}")
-            break
-
-        start_time += CHUNK_DURATION_SECONDS
-        chunk_num += 1
-
-    return chunks
-
-
-def transcribe_chunk(client: OpenAI, chunk_path: Path, language: Optional[str] = None) -> dict:
-    """Transcribe a single audio chunk"""
-    with open(chunk_path, "rb") as audio_file:
-        response = client.audio.transcriptions.create(
+        with process.stdout:
+            for chunk_num, line in enumerate(process.stdout):
+                chunk_path = temp_dir / line.strip()
+                size_mb = chunk_path.stat().st_size / (1024 * 1024)
+                print(f"    Chunk {chunk_num}: {size_mb:.1f}MB")
+                yield chunk_path
+
+        if process.wait() != 0:
+            stderr.seek(0)
+            raise RuntimeError(f"Failed to split audio: {stderr.read()[-200:]}")
+
+
+@retry(
+    # The SDK's own retries are off, so 5xx responses must be retried here too
+    retry=retry_if_exception_type((RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)),
+    wait=wait_retry_after,
+    stop=stop_after_attempt(5),
+    reraise=True,
+)
+def create_transcription(client: OpenAI, chunk_path: Path, language: Optional[str] = None):
+    """POST one file to Whisper, throttled by the shared token bucket"""
+    with _whisper_slots, open(chunk_path, "rb") as audio_file:
+        whisper_bucket.acquire()
+        return client.audio.transcriptions.create(
             model="whisper-1",
             file=audio_file,
             language=language,
@@ -96,6 +202,11 @@ def transcribe_chunk(client: OpenAI, chunk_path: Path, language: Optional[str] =
             timestamp_granularities=["segment"]
         )
 
+
+def transcribe_chunk(client: OpenAI, chunk_path: Path, language: Optional[str] = None) -> dict:
+    """Transcribe a single audio chunk"""
+    response = create_transcription(client, chunk_path, language)
+
     segments = []
     for seg in response.segments or []:
         segments.append({
@@ -111,13 +222,134 @@ def transcribe_chunk(client: OpenAI, chunk_path: Path, language: Optional[str] =
     }
 
 
+_local_model = None
+_local_model_failed = False
+_local_model_lock = threading.Lock()
+
+
+def get_local_model():
+    """Load the batched faster-whisper pipeline once; None if it isn't installed or won't load"""
+    global _local_model, _local_model_failed
+    with _local_model_lock:
+        if _local_model is None and WhisperModel is not None and not _local_model_failed:
+            try:
+                _local_model = BatchedInferencePipeline(model=WhisperModel(
+                    LOCAL_WHISPER_MODEL,
+                    device=LOCAL_WHISPER_DEVICE,
+                    compute_type=LOCAL_WHISPER_COMPUTE_TYPE,
+                ))
+            except Exception as e:
+                print(f"Local Whisper unavailable, using the OpenAI API: {e}")
+                _local_model_failed = True
+    return _local_model
+
+
+def warm_up_local_model():
+    """Start loading the local model in the background so the first file doesn't wait on it"""
+    if WhisperModel is not None:
+        threading.Thread(target=get_local_model, daemon=True).start()
+
+
+def transcribe_local(model, audio_path: Path, language: Optional[str] = None) -> dict:
+    """Transcribe a whole file locally; no size limit, so no chunking needed"""
+    segments_iter, info = model.transcribe(
+        str(audio_path),
+        language=language,
+        vad_filter=True,  # Skip silence instead of decoding it
+        word_timestamps=False,
+        batch_size=LOCAL_WHISPER_BATCH_SIZE,
+    )
+
+    segments = []
+    for seg in segments_iter:
+        segments.append({
+            "text": seg.text.strip(),
+            "start": seg.start,
+            "duration": seg.end - seg.start,
+            "end": seg.end
+        })
+
+    return {
+        "segments": segments,
+        "language": info.language or language or "en"
+    }
+
+
+def transcribe_chunk_file(client: OpenAI, chunk_path: Path) -> dict:
+    """Transcribe a chunk and delete its file once the transcript is in hand"""
+    result = transcribe_chunk(client, chunk_path)
+    try:
+        chunk_path.unlink()
+    except Exception:
+        pass
+    return result
+
+
+def transcribe_chunks(client: OpenAI, chunks: Iterable[Tuple[int, Path]]) -> dict:
+    """Transcribe (index, chunk_path) pairs concurrently; returns {index: result} for chunks that succeeded
+
+    Each chunk is submitted as soon as the iterable produces it, so uploads
+    overlap with a generator that is still encoding later chunks.
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENCY) as executor:
+        futures = {
+            executor.submit(transcribe_chunk_file, client, chunk_path): i
+            for i, chunk_path in chunks
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+                print(f"    Chunk {i+1}: got {len(results[i]['segments'])} segments")
+            except Exception as e:
+                print(f"    Error transcribing chunk {i+1}: {e}")
+    return results
+
+
+_client: Optional[OpenAI] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> OpenAI:
+    """Return the shared OpenAI client so every file and chunk reuses one connection pool"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                api_key = os.environ.get("OPENAI_API_KEY")
+                if not api_key:
+                    raise ValueError("OPENAI_API_KEY environment variable not set")
+                _client = OpenAI(
+                    api_key=api_key,
+                    # Retries are handled by create_transcription so they go through the token bucket
+                    max_retries=0,
+                    http_client=httpx.Client(
+                        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                        timeout=httpx.Timeout(600.0, connect=10.0),
+                    ),
+                )
+    return _client
+
+
 def transcribe_audio_file(audio_path: Path, temp_dir: Path) -> dict:
     """Transcribe a single audio file with chunking support"""
-    api_key = os.environ.get("OPENAI_API_KEY")
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY environment variable not set")
+    model = get_local_model()
+    if model is not None:
+        print(f"  Transcribing locally with {LOCAL_WHISPER_MODEL}...")
+        try:
+            result = transcribe_local(model, audio_path)
+            if result["segments"]:
+                return {
+                    "available": True,
+                    "language": result["language"],
+                    "is_auto_generated": True,
+                    "segments": result["segments"]
+                }
+        except Exception as e:
+            print(f"  Local transcription failed, falling back to the API: {e}")
 
-    client = OpenAI(api_key=api_key)
+    client = get_client()
 
     file_size = audio_path.stat().st_size
     file_size_mb = file_size / (1024 * 1024)
@@ -141,47 +373,57 @@ def transcribe_audio_file(audio_path: Path, temp_dir: Path) -> dict:
     # Need to compress or split
     print(f"  File too large or direct upload failed, splitting into chunks...")
 
-    # Create chunks
-    chunks = split_audio_to_chunks(audio_path, temp_dir)
+    # Transcribe chunks concurrently as ffmpeg finishes each one; encoding is
+    # CPU-bound and the API calls are network-bound, so the two overlap
+    print(f"  Transcribing chunks as they are encoded ({MAX_CONCURRENCY} at a time)...")
+    chunks = []
+
+    def produced_chunks():
+        for chunk_path in iter_audio_chunks(audio_path, temp_dir):
+            chunks.append(chunk_path)
+            yield len(chunks) - 1, chunk_path
+
+    results = transcribe_chunks(client, produced_chunks())
 
     if not chunks:
         print(f"  Failed to create chunks")
         return {"available": False}
 
-    # Transcribe each chunk
+    # Give failed chunks one more pass before giving up on the episode
+    failed = {i: chunks[i] for i in range(len(chunks)) if i not in results}
+    if failed:
+        print(f"  Retrying {len(failed)} failed chunks...")
+        results.update(transcribe_chunks(client, failed.items()))
+    failed = [i + 1 for i in range(len(chunks)) if i not in results]
+
+    # Reassemble in chunk order, shifting timestamps by each chunk's start
     all_segments = []
     detected_language = "en"
-    time_offset = 0.0
-
-    for i, chunk_path in enumerate(chunks):
-        print(f"  Transcribing chunk {i+1}/{len(chunks)}...")
-        try:
-            result = transcribe_chunk(client, chunk_path)
-            detected_language = result["language"]
-
-            # Adjust timestamps for this chunk
-            for seg in result["segments"]:
-                all_segments.append({
-                    "text": seg["text"],
-                    "start": seg["start"] + time_offset,
-                    "duration": seg["duration"],
-                    "end": seg["end"] + time_offset
-                })
 
-            print(f"    Got {len(result['segments'])} segments")
-
-        except Exception as e:
-            print(f"    Error transcribing chunk {i+1}: {e}")
-
-        # Update offset for next chunk
-        time_offset += CHUNK_DURATION_SECONDS
-
-        # Cleanup chunk file
+    for i in sorted(results):
+        result = results[i]
+        detected_language = result["language"]
+        time_offset = i * CHUNK_DURATION_SECONDS
+        for seg in result["segments"]:
+            all_segments.append({
+                "text": seg["text"],
+                "start": seg["start"] + time_offset,
+                "duration": seg["duration"],
+                "end": seg["end"] + time_offset
+            })
+
+    # Chunks that failed are left behind by the workers
+    for chunk_path in chunks:
         try:
             chunk_path.unlink()
         except Exception:
             pass
 
+    # A transcript with holes would be saved as a success and never retried
+    if failed:
+        print(f"  Chunks {failed} failed after retries")
+        return {"available": False, "error": f"Chunks {failed} failed to transcribe"}
+
     if all_segments:
         print(f"  Total segments: {len(all_segments)}")
         return {
@@ -194,18 +436,73 @@ def transcribe_audio_file(audio_path: Path, temp_dir: Path) -> dict:
         return {"available": False}
 
 
+def apply_transcript_update(data: dict, by_filename: dict, entry: dict) -> bool:
+    """Apply one journal entry to the loaded data; returns True if it added a success"""
+    filename = entry['filename']
+    ep = by_filename.get(filename)
+    newly_available = ep is None or not ep.get('transcript', {}).get('available', False)
+    if ep is not None:
+        ep['transcript'] = entry['transcript']
+    else:
+        ep = {
+            'filename': filename,
+            'title': entry['title'],
+            'episode_number': entry['episode_number'],
+            'transcript': entry['transcript']
+        }
+        data['episodes'].append(ep)
+        by_filename[filename] = ep
+    data['errors'] = [e for e in data['errors'] if e['filename'] != filename]
+    return newly_available
+
+
+def replay_journal(journal_path: Path, data: dict, by_filename: dict) -> int:
+    """Apply updates journaled by an interrupted run; returns how many were applied"""
+    if not journal_path.exists():
+        return 0
+    applied = 0
+    with open(journal_path, 'rb') as f:
+        for line in f:
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                break  # Torn final line from a crash mid-write
+            apply_transcript_update(data, by_filename, entry)
+            applied += 1
+    return applied
+
+
+def write_output(output_file: Path, data: dict):
+    """Compact everything into the full JSON output file"""
+    data['episodes'].sort(key=lambda x: x.get('episode_number') or 999)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
 def main():
     # Paths
     source_dir = Path(r"C:\Users\jim\Videos\4K Video Downloader+\Personal Injury Mastermind (PIM) Podcast (Season 1)")
     output_file = Path(r"C:\Users\jim\OneDrive\Documents\Delisi\pim_podcast_transcripts.json")
     temp_dir = Path(r"C:\Users\jim\AppData\Local\Temp\transcription_chunks")
 
+    # Model weights load while the existing transcripts are read below
+    warm_up_local_model()
+
     # Create temp directory
     temp_dir.mkdir(parents=True, exist_ok=True)
+    duration_cache_path = temp_dir / DURATION_CACHE_NAME
+    load_duration_cache(duration_cache_path)
 
-    # Load existing data
+    # Load existing data, folding in anything journaled by an interrupted run
     with open(output_file, 'r', encoding='utf-8') as f:
         data = json.load(f)
+    by_filename = {ep['filename']: ep for ep in data['episodes']}
+    journal_path = output_file.with_suffix('.jsonl.journal')
+    recovered = replay_journal(journal_path, data, by_filename)
+    if recovered:
+        print(f"Recovered {recovered} transcripts from {journal_path.name}")
+        write_output(output_file, data)
+        journal_path.unlink()
 
     # Find failed episodes
     failed_filenames = {e['filename'] for e in data.get('errors', [])}
@@ -215,6 +512,10 @@ def main():
     retried = 0
     newly_successful = 0
     still_failed = []
+    successful = sum(1 for ep in data['episodes'] if ep.get('transcript', {}).get('available', False))
+
+    # Successful retries are appended here; the full JSON is only rewritten at the end
+    journal = open(journal_path, 'ab')
 
     for filename in sorted(failed_filenames):
         audio_path = source_dir / filename
@@ -239,46 +540,38 @@ def main():
                 transcript["word_count"] = len(full_text.split())
                 transcript["character_count"] = len(full_text)
 
-                # Find and update the episode in the data
-                for ep in data['episodes']:
-                    if ep['filename'] == filename:
-                        ep['transcript'] = transcript
-                        break
-                else:
-                    # Add new episode entry
-                    import re
-                    ep_match = re.search(r'Ep\.?\s*(\d+)', filename, re.IGNORECASE)
-                    episode_number = int(ep_match.group(1)) if ep_match else None
-                    data['episodes'].append({
-                        'filename': filename,
-                        'title': audio_path.stem,
-                        'episode_number': episode_number,
-                        'transcript': transcript
-                    })
-
-                # Remove from errors list
-                data['errors'] = [e for e in data['errors'] if e['filename'] != filename]
+                ep_match = EPISODE_NUMBER_RE.search(filename)
+                entry = {
+                    'op': 'update',
+                    'filename': filename,
+                    'title': audio_path.stem,
+                    'episode_number': int(ep_match.group(1)) if ep_match else None,
+                    'transcript': transcript
+                }
+
+                # Journal the result before touching the in-memory data
+                journal.write(orjson.dumps(entry) + b"\n")
+                journal.flush()
+                if apply_transcript_update(data, by_filename, entry):
+                    successful += 1
 
             else:
-                print(f"  FAILED: No transcript generated")
-                still_failed.append({"filename": filename, "error": "No transcript generated"})
+                error = transcript.get("error", "No transcript generated")
+                print(f"  FAILED: {error}")
+                still_failed.append({"filename": filename, "error": error})
 
         except Exception as e:
             print(f"  ERROR: {e}")
             still_failed.append({"filename": filename, "error": str(e)})
 
-        # Save progress after each episode
-        data['extraction_metadata']['successful_extractions'] = sum(
-            1 for ep in data['episodes'] if ep.get('transcript', {}).get('available', False)
-        )
-        data['extraction_metadata']['failed_extractions'] = len(data['errors']) + len(still_failed)
-        data['extraction_metadata']['extracted_at'] = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
-
-        # Sort episodes by episode number
-        data['episodes'].sort(key=lambda x: x.get('episode_number') or 999)
+    journal.close()
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    # Compact the journal into the output file once, now that all retries are in
+    data['extraction_metadata']['successful_extractions'] = successful
+    data['extraction_metadata']['failed_extractions'] = len(data['errors']) + len(still_failed)
+    data['extraction_metadata']['extracted_at'] = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+    write_output(output_file, data)
+    journal_path.unlink(missing_ok=True)
 
     # Final summary
     print(f"\n{'='*60}")
@@ -289,11 +582,12 @@ def main():
     print(f"Still failed: {len(still_failed)}")
     print(f"{'='*60}")
 
-    # Clean up temp directory
+    # Clean up temp directory, keeping the duration cache for the next run
+    save_duration_cache(duration_cache_path)
     try:
         for f in temp_dir.iterdir():
-            f.unlink()
-        temp_dir.rmdir()
+            if f != duration_cache_path:
+                f.unlink()
     except Exception:
         pass
 
@@ -2,7 +2,10 @@
 Designed to run unattended. Resume-safe — skips already-transcribed episodes."""
 
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
@@ -31,31 +34,45 @@ seasons = [
     },
 ]
 
+# Seasons are independent and network-bound; each still transcribes one file at a time
+MAX_PARALLEL_SEASONS = 3
+MAX_IN_FLIGHT_UPSERTS = 8  # Async Pinecone upserts outstanding while the next batch embeds
+
 if __name__ == "__main__":
     log = Path(__file__).parent / "pim_transcription_log.txt"
+    log_lock = threading.Lock()
 
     def log_msg(msg):
         line = f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {msg}"
-        print(line)
-        with open(log, "a", encoding="utf-8") as f:
-            f.write(line + "\n")
-
-    log_msg("=== PIM Batch Transcription Started ===")
+        with log_lock:
+            print(line)
+            with open(log, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
 
-    for season in seasons:
+    def run_season(season):
         log_msg(f"Starting {season['name']}...")
         start = time.time()
-        try:
-            transcribe_audio_files(season["source"], season["output"])
-            elapsed = time.time() - start
-            log_msg(f"{season['name']} complete in {elapsed/60:.1f} minutes")
-        except Exception as e:
-            log_msg(f"ERROR in {season['name']}: {e}")
+        transcribe_audio_files(season["source"], season["output"])
+        return time.time() - start
+
+    log_msg("=== PIM Batch Transcription Started ===")
+
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_SEASONS) as executor:
+        futures = {executor.submit(run_season, season): season for season in seasons}
+        for future in as_completed(futures):
+            season = futures[future]
+            try:
+                elapsed = future.result()
+                log_msg(f"{season['name']} complete in {elapsed/60:.1f} minutes")
+            except Exception as e:
+                log_msg(f"ERROR in {season['name']}: {e}")
 
     log_msg("=== All transcriptions complete. Starting Pinecone ingestion... ===")
 
     try:
-        from ingest_to_pinecone import process_transcript_file, get_embedding, index
+        from ingest_to_pinecone import (
+            EMBEDDING_BATCH_SIZE, get_embeddings_batch, index, process_transcript_file,
+        )
 
         pim_files = [
             f"{OUTPUT}\\PIM_Podcast_Season1.json",
@@ -65,6 +82,34 @@ if __name__ == "__main__":
         total_chunks = 0
         batch = []
         batch_size = 100
+        in_flight = deque()
+
+        def upsert_async(vectors):
+            """Start an upsert without waiting on it, reaping the oldest once the window is full"""
+            if len(in_flight) >= MAX_IN_FLIGHT_UPSERTS:
+                in_flight.popleft().get()
+            in_flight.append(index.upsert(vectors=vectors, async_req=True))
+
+        def embed_pending(pending):
+            """Embed buffered chunks in one request and queue them for upsert"""
+            global batch, total_chunks
+            try:
+                embeddings = get_embeddings_batch([c["text"] for c in pending])
+            except Exception as e:
+                log_msg(f"  Embedding error, skipping {len(pending)} chunks: {e}")
+                return 0
+            for chunk_data, embedding in zip(pending, embeddings):
+                batch.append({
+                    "id": chunk_data["id"],
+                    "values": embedding,
+                    "metadata": chunk_data["metadata"],
+                })
+                total_chunks += 1
+                if len(batch) >= batch_size:
+                    upsert_async(batch)
+                    log_msg(f"  Queued upsert of {len(batch)} (total: {total_chunks})")
+                    batch = []
+            return len(pending)
 
         for pim_file in pim_files:
             p = Path(pim_file)
@@ -73,28 +118,21 @@ if __name__ == "__main__":
                 continue
             log_msg(f"Ingesting: {p.name}")
             file_chunks = 0
+            pending = []
             for chunk_data in process_transcript_file(p):
-                try:
-                    embedding = get_embedding(chunk_data["text"])
-                except Exception as e:
-                    log_msg(f"  Embedding error: {e}")
-                    continue
-                batch.append({
-                    "id": chunk_data["id"],
-                    "values": embedding,
-                    "metadata": chunk_data["metadata"],
-                })
-                file_chunks += 1
-                total_chunks += 1
-                if len(batch) >= batch_size:
-                    index.upsert(vectors=batch)
-                    log_msg(f"  Upserted batch of {len(batch)} (total: {total_chunks})")
-                    batch = []
+                pending.append(chunk_data)
+                if len(pending) >= EMBEDDING_BATCH_SIZE:
+                    file_chunks += embed_pending(pending)
+                    pending = []
+            if pending:
+                file_chunks += embed_pending(pending)
             log_msg(f"  {file_chunks} chunks from {p.name}")
 
         if batch:
-            index.upsert(vectors=batch)
-            log_msg(f"  Upserted final batch of {len(batch)}")
+            upsert_async(batch)
+            log_msg(f"  Queued final upsert of {len(batch)}")
+        while in_flight:
+            in_flight.popleft().get()
 
         stats = index.describe_index_stats()
         log_msg(f"Pinecone index now has {stats.total_vector_count} vectors")
@@ -2,26 +2,30 @@
 
 import os
 import json
+import atexit
 import logging
+import queue
 import time
 import threading
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import quote_plus
 
 import feedparser
+import orjson
 import requests
 from flask import Flask, render_template, request, jsonify, Response, send_file, abort, send_from_directory
 
 from database import (
     create_conversation,
-    add_message,
+    add_messages,
     get_conversation_messages,
     get_all_conversations,
     update_conversation_title,
     delete_conversation,
     generate_title_from_message,
 )
-from rag import search_knowledge_base, build_prompt, stream_response, SOURCE_DISPLAY_NAMES, TAKEAWAYS_INDEX
+from rag import search_knowledge_base, build_prompt, stream_response, warmup, SOURCE_DISPLAY_NAMES, TAKEAWAYS_INDEX
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +33,76 @@ app = Flask(__name__, static_folder="static", template_folder="templates")
 
 OUTPUT_DIR = Path("/app/output")
 REFRESH_LOG_PATH = Path("refresh_log.json")
+FILE_LIST_TTL_SECONDS = 30  # Also catches files rewritten in place, which leave the dir mtime alone
+
+
+def _warmup_rag():
+    """Warm RAG clients in the background so startup isn't blocked."""
+    try:
+        warmup()
+    except Exception as e:
+        logger.warning(f"RAG warmup failed: {e}")
+
+
+threading.Thread(target=_warmup_rag, daemon=True).start()
+
+
+# Chat messages are saved by a background writer so DB round trips stay off the SSE path
+_db_queue: queue.Queue = queue.Queue()
+DB_WRITE_WINDOW_SECONDS = 0.05  # Coalesce messages arriving this close together into one transaction
+_DB_WRITER_STOP = object()  # Queued at exit so the writer finishes its batch and returns
+
+
+def _queue_message(conversation_id, role, content):
+    """Queue a chat message for the background DB writer."""
+    _db_queue.put((conversation_id, role, content))
+
+
+def _drain_db_queue(batch):
+    """Pull everything already queued into batch without waiting."""
+    while True:
+        try:
+            batch.append(_db_queue.get_nowait())
+        except queue.Empty:
+            return batch
+
+
+def _write_messages(batch):
+    try:
+        add_messages(batch)
+    except Exception as e:
+        logger.error(f"Failed to save {len(batch)} chat messages: {e}")
+
+
+def _db_writer():
+    """Write queued messages in batches, one transaction per DB_WRITE_WINDOW_SECONDS."""
+    while True:
+        first = _db_queue.get()
+        if first is not _DB_WRITER_STOP:
+            time.sleep(DB_WRITE_WINDOW_SECONDS)
+        batch = _drain_db_queue([first])
+        stopping = any(m is _DB_WRITER_STOP for m in batch)
+        batch = [m for m in batch if m is not _DB_WRITER_STOP]
+        if batch:
+            _write_messages(batch)
+        if stopping:
+            return
+
+
+@atexit.register
+def _flush_db_queue():
+    """Let the writer save its pending batch and everything still queued at shutdown."""
+    _db_queue.put(_DB_WRITER_STOP)
+    _db_writer_thread.join(timeout=10)
+    if not _db_writer_thread.is_alive():
+        # Anything queued after the writer stopped
+        batch = _drain_db_queue([])
+        if batch:
+            _write_messages(batch)
+
+
+_db_writer_thread = threading.Thread(target=_db_writer, daemon=True)
+_db_writer_thread.start()
 
 
 # ============================================
@@ -45,21 +119,34 @@ def index():
 # EXISTING ROUTES (preserved)
 # ============================================
 
+@lru_cache(maxsize=1)
+def _list_output_files(dir_mtime_ns, ttl_bucket):
+    """Stat every JSON in OUTPUT_DIR; cached until a file is added/removed or the TTL rolls over."""
+    files = []
+    # scandir entries carry file type from the directory read, so only sizes need a stat
+    with os.scandir(OUTPUT_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            size = entry.stat().st_size
+            files.append({
+                "name": entry.name,
+                "size_bytes": size,
+                "size_mb": round(size / (1024 * 1024), 2),
+                "download_url": f"/download/{entry.name}"
+            })
+    return files
+
+
 @app.route("/files")
 def list_files():
     """List available files for download."""
-    if not OUTPUT_DIR.exists():
+    try:
+        dir_mtime_ns = OUTPUT_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
         return jsonify({"error": "Output directory not found", "files": []})
 
-    files = []
-    for f in OUTPUT_DIR.glob("*.json"):
-        stat = f.stat()
-        files.append({
-            "name": f.name,
-            "size_bytes": stat.st_size,
-            "size_mb": round(stat.st_size / (1024 * 1024), 2),
-            "download_url": f"/download/{f.name}"
-        })
+    files = _list_output_files(dir_mtime_ns, int(time.monotonic() // FILE_LIST_TTL_SECONDS))
 
     return jsonify({
         "message": "YouTube Transcript Extractor - File Server",
@@ -79,14 +166,20 @@ def download_file(filename):
 
     file_path = OUTPUT_DIR / filename
 
-    if not file_path.exists():
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
         abort(404, f"File not found: {filename}")
 
+    # Repeat downloads of an unchanged file get a 304 with no body
     return send_file(
         file_path,
         as_attachment=True,
         download_name=filename,
-        mimetype="application/json"
+        mimetype="application/json",
+        conditional=True,
+        etag=f"{stat.st_mtime_ns:x}-{stat.st_size:x}",
+        last_modified=stat.st_mtime,
     )
 
 
@@ -138,6 +231,15 @@ def remove_conversation(conv_id):
 # SSE CHAT STREAMING
 # ============================================
 
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+
+def _sse_event(payload):
+    """Encode one SSE frame as bytes, so Flask passes it straight through."""
+    return _SSE_PREFIX + orjson.dumps(payload) + _SSE_SUFFIX
+
+
 @app.route("/api/chat/stream", methods=["POST"])
 def chat_stream():
     """SSE endpoint for streaming Claude responses."""
@@ -156,11 +258,11 @@ def chat_stream():
         update_conversation_title(conversation_id, title)
 
     # Save user message
-    add_message(conversation_id, "user", query)
+    _queue_message(conversation_id, "user", query)
 
-    # Get conversation history for context (exclude the message we just added)
+    # Get conversation history for context (exclude the message we just queued)
     history = get_conversation_messages(conversation_id)
-    # Remove the last user message (we include it separately in build_prompt)
+    # Remove the last user message if the writer already saved it (we include it separately in build_prompt)
     if history and history[-1]["role"] == "user" and history[-1]["content"] == query:
         history = history[:-1]
     # Limit to recent history
@@ -171,7 +273,7 @@ def chat_stream():
 
     def generate():
         # Send conversation_id so client can track it
-        yield f"data: {json.dumps({'type': 'meta', 'conversation_id': conversation_id})}\n\n"
+        yield _sse_event({'type': 'meta', 'conversation_id': conversation_id})
 
         if not chunks:
             logger.info(f"No results for query: {query}")
@@ -184,9 +286,9 @@ def chat_stream():
                 "- Broadening your topic\n\n"
                 "If you think this topic should be covered, let me know so we can add relevant content."
             )
-            yield f"data: {json.dumps({'type': 'text', 'content': no_results_msg})}\n\n"
-            yield f"data: {json.dumps({'type': 'done', 'sources': []})}\n\n"
-            add_message(conversation_id, "assistant", no_results_msg)
+            yield _sse_event({'type': 'text', 'content': no_results_msg})
+            yield _sse_event({'type': 'done', 'sources': []})
+            _queue_message(conversation_id, "assistant", no_results_msg)
             return
 
         system_prompt, messages, sources_text = build_prompt(query, chunks, history)
@@ -195,12 +297,12 @@ def chat_stream():
         try:
             for text_chunk in stream_response(system_prompt, messages):
                 full_response += text_chunk
-                yield f"data: {json.dumps({'type': 'text', 'content': text_chunk})}\n\n"
+                yield _sse_event({'type': 'text', 'content': text_chunk})
         except Exception as e:
             logger.error(f"Claude API error: {e}")
             error_msg = f"Sorry, I encountered an error generating a response: {str(e)}"
-            yield f"data: {json.dumps({'type': 'error', 'content': error_msg})}\n\n"
-            add_message(conversation_id, "assistant", error_msg)
+            yield _sse_event({'type': 'error', 'content': error_msg})
+            _queue_message(conversation_id, "assistant", error_msg)
             return
 
         # Send sources as structured data with display names
@@ -216,14 +318,15 @@ def chat_stream():
                 seen.add(key)
                 sources_list.append({"source": display_source, "episode": episode})
 
-        yield f"data: {json.dumps({'type': 'done', 'sources': sources_list})}\n\n"
+        yield _sse_event({'type': 'done', 'sources': sources_list})
 
         # Save full response to database (include sources HTML for history)
-        add_message(conversation_id, "assistant", full_response + sources_text)
+        _queue_message(conversation_id, "assistant", full_response + sources_text)
 
     return Response(
         generate(),
         mimetype="text/event-stream",
+        direct_passthrough=True,
         headers={
             "Cache-Control": "no-cache",
             "X-Accel-Buffering": "no",
@@ -1,8 +1,12 @@
 """Audio downloader for YouTube videos"""
 
+import copy
 import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 import yt_dlp
 
 
@@ -17,31 +21,15 @@ class AudioDownloader:
         """
         self.output_dir = output_dir or Path("./temp/audio")
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._ydl_opts = self._build_ydl_opts()
+        # YoutubeDL isn't thread-safe, so each thread reuses its own instance
+        self._local = threading.local()
 
-    def download_audio(self, video_id: str) -> Optional[Path]:
-        """Download audio from a YouTube video
-
-        Args:
-            video_id: YouTube video ID
-
-        Returns:
-            Path to downloaded audio file, or None if download failed
-        """
-        # Check for both MP3 and WebM (fallback if FFmpeg not available)
-        mp3_path = self.output_dir / f"{video_id}.mp3"
-        webm_path = self.output_dir / f"{video_id}.webm"
-        m4a_path = self.output_dir / f"{video_id}.m4a"
-
-        # Return existing file if already downloaded
-        for path in [mp3_path, webm_path, m4a_path]:
-            if path.exists():
-                print(f"Audio already exists: {path}")
-                return path
-
+    def _build_ydl_opts(self) -> dict:
+        """Build yt-dlp options once; they don't vary per video"""
         # Check for FFmpeg in PATH, otherwise use explicit location
         ffmpeg_location = None
         try:
-            import shutil
             if not shutil.which('ffmpeg'):
                 # Try default Windows installation location
                 default_ffmpeg = Path(r"C:\ffmpeg\ffmpeg-master-latest-win64-gpl\bin")
@@ -52,9 +40,10 @@ class AudioDownloader:
 
         ydl_opts = {
             'format': 'bestaudio/best',
-            'outtmpl': str(self.output_dir / f"{video_id}.%(ext)s"),
+            'outtmpl': str(self.output_dir / "%(id)s.%(ext)s"),
             'quiet': True,
             'no_warnings': True,
+            'concurrent_fragment_downloads': 4,  # Parallel HLS/DASH fragments
         }
 
         # Only add FFmpeg postprocessing if FFmpeg is available
@@ -66,10 +55,39 @@ class AudioDownloader:
                 'preferredquality': '192',
             }]
 
+        return ydl_opts
+
+    def _get_ydl(self) -> yt_dlp.YoutubeDL:
+        """Return this thread's YoutubeDL, creating it on first use"""
+        ydl = getattr(self._local, "ydl", None)
+        if ydl is None:
+            # yt-dlp rewrites the params it's given, so each instance gets its own copy
+            ydl = self._local.ydl = yt_dlp.YoutubeDL(copy.deepcopy(self._ydl_opts))
+        return ydl
+
+    def download_audio(self, video_id: str) -> Optional[Path]:
+        """Download audio from a YouTube video
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            Path to downloaded audio file, or None if download failed
+        """
+        # Check for both MP3 and WebM (fallback if FFmpeg not available)
+        mp3_path = self.output_dir / f"{video_id}.mp3"
+        webm_path = self.output_dir / f"{video_id}.webm"
+        m4a_path = self.output_dir / f"{video_id}.m4a"
+
+        # Return existing file if already downloaded
+        for path in [mp3_path, webm_path, m4a_path]:
+            if path.exists():
+                print(f"Audio already exists: {path}")
+                return path
+
         try:
             url = f"https://www.youtube.com/watch?v={video_id}"
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
+            self._get_ydl().download([url])
 
             # Check which file was created (prefer MP3, fallback to WebM/M4A)
             for path in [mp3_path, webm_path, m4a_path]:
@@ -83,6 +101,19 @@ class AudioDownloader:
             print(f"Error downloading audio for {video_id}: {str(e)}")
             return None
 
+    def download_many(self, video_ids: List[str], max_workers: int = 4) -> Dict[str, Optional[Path]]:
+        """Download audio for several videos concurrently
+
+        Args:
+            video_ids: YouTube video IDs
+            max_workers: Number of parallel downloads
+
+        Returns:
+            Mapping of video ID to downloaded audio path (None if the download failed)
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(video_ids, executor.map(self.download_audio, video_ids)))
+
     def cleanup(self, video_id: str) -> None:
         """Delete downloaded audio file
 
@@ -2,13 +2,38 @@
 
 import re
 import requests
-import xml.etree.ElementTree as ET
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from lxml import etree as ET
 from datetime import datetime
-from typing import List, Optional, Tuple
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..models.podcast import Podcast, Episode
 
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Copy buffer for enclosure downloads; the copy loop runs inside
+# shutil.copyfileobj, so only progress reporting touches each block
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _build_session() -> requests.Session:
+    """Create a pooled HTTP session so feed and enclosure requests reuse connections"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+        pool_connections=16,
+        pool_maxsize=32,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 def parse_duration(duration_str: str) -> Optional[int]:
     """Parse duration string to seconds
@@ -21,57 +46,41 @@ def parse_duration(duration_str: str) -> Optional[int]:
     if not duration_str:
         return None
 
-    duration_str = duration_str.strip()
-
-    # Try HH:MM:SS or MM:SS format
-    if ":" in duration_str:
-        parts = duration_str.split(":")
-        try:
-            if len(parts) == 3:
-                return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-            elif len(parts) == 2:
-                return int(parts[0]) * 60 + int(parts[1])
-        except ValueError:
-            pass
+    parts = duration_str.strip().split(":")
+    if len(parts) > 3:
+        return None
 
-    # Try pure seconds
-    try:
-        return int(duration_str)
-    except ValueError:
-        pass
+    # Horner-style accumulation covers all three formats in one pass and
+    # rejects junk without raising and catching ValueError
+    total = 0
+    for part in parts:
+        if not part.isdecimal():
+            return None
+        total = total * 60 + int(part)
 
-    return None
+    return total
 
 
+@lru_cache(maxsize=4096)
 def parse_pub_date(date_str: str) -> Optional[datetime]:
-    """Parse RSS pubDate to datetime"""
+    """Parse RSS pubDate to datetime (cached, datetimes are immutable)"""
     if not date_str:
         return None
 
-    # Common RSS date formats
-    formats = [
-        "%a, %d %b %Y %H:%M:%S %z",
-        "%a, %d %b %Y %H:%M:%S %Z",
-        "%Y-%m-%dT%H:%M:%S%z",
-        "%Y-%m-%d",
-    ]
+    date_str = date_str.strip()
 
-    for fmt in formats:
+    # ISO 8601 starts with the year; everything else is treated as RFC 2822,
+    # the RSS pubDate format, so each string gets a single parse attempt
+    if date_str[:4].isdigit():
         try:
-            return datetime.strptime(date_str.strip(), fmt)
+            return datetime.fromisoformat(date_str)
         except ValueError:
-            continue
+            return None
 
-    # Try without timezone
     try:
-        # Remove timezone info and parse
-        date_clean = re.sub(r'\s*[+-]\d{4}$', '', date_str.strip())
-        date_clean = re.sub(r'\s*\w{3,4}$', '', date_clean)
-        return datetime.strptime(date_clean, "%a, %d %b %Y %H:%M:%S")
-    except ValueError:
-        pass
-
-    return None
+        return parsedate_to_datetime(date_str)
+    except (TypeError, ValueError):
+        return None
 
 
 class PodcastFetcher:
@@ -84,6 +93,23 @@ class PodcastFetcher:
         'atom': 'http://www.w3.org/2005/Atom',
     }
 
+    # Namespace-expanded (Clark notation) tags, matched directly against child.tag
+    _NS_ITUNES = '{' + NAMESPACES['itunes'] + '}'
+    _TAG_ITUNES_DURATION = _NS_ITUNES + 'duration'
+    _TAG_ITUNES_IMAGE = _NS_ITUNES + 'image'
+    _TAG_ITUNES_SUMMARY = _NS_ITUNES + 'summary'
+    _TAG_ITUNES_AUTHOR = _NS_ITUNES + 'author'
+    _TAG_ITUNES_CATEGORY = _NS_ITUNES + 'category'
+
+    # libxml2 parser options; huge_tree lifts the depth/size limits that
+    # large back catalogues can hit
+    PARSER_OPTIONS = {
+        'huge_tree': True,
+        'collect_ids': False,
+        'remove_blank_text': True,
+        'resolve_entities': False,
+    }
+
     def __init__(self, feed_url: str):
         """Initialize with RSS feed URL
 
@@ -91,6 +117,7 @@ class PodcastFetcher:
             feed_url: URL to the podcast RSS feed
         """
         self.feed_url = feed_url
+        self._session = _build_session()
 
     def fetch_feed(self) -> Tuple[Podcast, List[Episode]]:
         """Fetch and parse the RSS feed
@@ -100,40 +127,28 @@ class PodcastFetcher:
         """
         print(f"Fetching RSS feed: {self.feed_url}")
 
-        response = requests.get(self.feed_url, timeout=30)
-        response.raise_for_status()
-
-        # Parse XML
-        root = ET.fromstring(response.content)
-        channel = root.find('channel')
-
-        if channel is None:
-            raise ValueError("Invalid RSS feed: no channel element found")
-
-        # Parse podcast metadata
-        podcast = self._parse_podcast(channel)
-
-        # Parse episodes
-        episodes = self._parse_episodes(channel)
+        response = self._session.get(self.feed_url, stream=True, timeout=30)
+        try:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            podcast, episodes = self._parse_stream(response.raw)
+        finally:
+            response.close()
 
         print(f"Found {len(episodes)} episodes")
 
         return podcast, episodes
 
-    def _parse_podcast(self, channel: ET.Element) -> Podcast:
+    def _parse_podcast(self, channel: ET._Element) -> Podcast:
         """Parse podcast metadata from channel element"""
 
         def get_text(tag: str, default: str = "") -> str:
             elem = channel.find(tag)
             return elem.text if elem is not None and elem.text else default
 
-        def get_itunes_text(tag: str, default: str = "") -> str:
-            elem = channel.find(f'itunes:{tag}', self.NAMESPACES)
-            return elem.text if elem is not None and elem.text else default
-
         # Get image URL
         image_url = ""
-        itunes_image = channel.find('itunes:image', self.NAMESPACES)
+        itunes_image = channel.find(self._TAG_ITUNES_IMAGE)
         if itunes_image is not None:
             image_url = itunes_image.get('href', '')
         if not image_url:
@@ -143,15 +158,15 @@ class PodcastFetcher:
 
         # Get categories
         categories = []
-        for cat in channel.findall('itunes:category', self.NAMESPACES):
+        for cat in channel.findall(self._TAG_ITUNES_CATEGORY):
             cat_text = cat.get('text')
             if cat_text:
                 categories.append(cat_text)
 
         return Podcast(
             title=get_text('title', 'Unknown Podcast'),
-            description=get_text('description') or get_itunes_text('summary'),
-            author=get_itunes_text('author') or get_text('managingEditor'),
+            description=get_text('description') or get_text(self._TAG_ITUNES_SUMMARY),
+            author=get_text(self._TAG_ITUNES_AUTHOR) or get_text('managingEditor'),
             website_url=get_text('link'),
             feed_url=self.feed_url,
             image_url=image_url,
@@ -159,30 +174,51 @@ class PodcastFetcher:
             categories=categories,
         )
 
-    def _parse_episodes(self, channel: ET.Element) -> List[Episode]:
-        """Parse all episodes from channel"""
+    def _parse_stream(self, source) -> Tuple[Podcast, List[Episode]]:
+        """Parse the feed incrementally as it arrives over the network
+
+        Each item is parsed on its end event and then dropped from the tree,
+        so only the channel metadata and the current item are held in memory.
+        """
+        podcast = None
         episodes = []
 
-        for item in channel.findall('item'):
-            episode = self._parse_episode(item)
-            if episode:
-                episodes.append(episode)
+        context = ET.iterparse(
+            source, events=('end',), tag=('item', 'channel'), **self.PARSER_OPTIONS
+        )
+        for _, elem in context:
+            parent = elem.getparent()
+            if elem.tag == 'item':
+                if parent is None or parent.tag != 'channel':
+                    continue
+                episode = self._parse_episode(elem)
+                if episode:
+                    episodes.append(episode)
+                elem.clear(keep_tail=True)
+                parent.remove(elem)
+            elif podcast is None and parent is not None and parent.getparent() is None:
+                podcast = self._parse_podcast(elem)
+                elem.clear(keep_tail=True)
+
+        if podcast is None:
+            raise ValueError("Invalid RSS feed: no channel element found")
 
-        return episodes
+        return podcast, episodes
 
-    def _parse_episode(self, item: ET.Element) -> Optional[Episode]:
+    def _parse_episode(self, item: ET._Element) -> Optional[Episode]:
         """Parse a single episode from item element"""
+        # Index the children in one pass instead of a linear find() per field;
+        # the first occurrence of a tag wins, as with find()
+        children = {}
+        for child in item:
+            children.setdefault(child.tag, child)
 
         def get_text(tag: str, default: str = "") -> str:
-            elem = item.find(tag)
-            return elem.text if elem is not None and elem.text else default
-
-        def get_itunes_text(tag: str, default: str = "") -> str:
-            elem = item.find(f'itunes:{tag}', self.NAMESPACES)
+            elem = children.get(tag)
             return elem.text if elem is not None and elem.text else default
 
         # Get audio URL from enclosure
-        enclosure = item.find('enclosure')
+        enclosure = children.get('enclosure')
         if enclosure is None:
             return None
 
@@ -191,22 +227,21 @@ class PodcastFetcher:
             return None
 
         # Get GUID
-        guid_elem = item.find('guid')
-        guid = guid_elem.text if guid_elem is not None and guid_elem.text else audio_url
+        guid = get_text('guid', audio_url)
 
         # Get duration
-        duration_str = get_itunes_text('duration')
+        duration_str = get_text(self._TAG_ITUNES_DURATION)
         duration = parse_duration(duration_str)
 
         # Get image
         image_url = ""
-        itunes_image = item.find('itunes:image', self.NAMESPACES)
+        itunes_image = children.get(self._TAG_ITUNES_IMAGE)
         if itunes_image is not None:
             image_url = itunes_image.get('href', '')
 
         # Clean up description (remove HTML tags for plain text)
-        description = get_text('description') or get_itunes_text('summary')
-        description = re.sub(r'<[^>]+>', '', description)  # Strip HTML
+        description = get_text('description') or get_text(self._TAG_ITUNES_SUMMARY)
+        description = _HTML_TAG_RE.sub('', description)  # Strip HTML
 
         return Episode(
             guid=guid,
@@ -220,6 +255,26 @@ class PodcastFetcher:
         )
 
 
+class _ProgressWriter:
+    """File wrapper that prints download progress as blocks are written"""
+
+    def __init__(self, f, total_size: int):
+        self._f = f
+        self._total_size = total_size
+        self._downloaded = 0
+        self._last_pct = -1
+
+    def write(self, data: bytes) -> int:
+        written = self._f.write(data)
+        self._downloaded += len(data)
+        pct = (self._downloaded / self._total_size) * 100
+        # Only redraw the progress line when the whole percent changes
+        if int(pct) != self._last_pct:
+            self._last_pct = int(pct)
+            print(f"\r  {pct:.1f}% ({self._downloaded / 1024 / 1024:.1f}MB)", end="", flush=True)
+        return written
+
+
 class AudioDownloader:
     """Download audio files from URLs"""
 
@@ -231,13 +286,15 @@ class AudioDownloader:
         """
         self.output_dir = output_dir or Path("./temp/audio")
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._session = _build_session()
 
-    def download(self, url: str, filename: str) -> Optional[Path]:
+    def download(self, url: str, filename: str, show_progress: bool = True) -> Optional[Path]:
         """Download audio file from URL
 
         Args:
             url: URL to download from
             filename: Base filename (without extension)
+            show_progress: Print a progress line while downloading
 
         Returns:
             Path to downloaded file, or None if failed
@@ -258,22 +315,20 @@ class AudioDownloader:
 
         try:
             print(f"Downloading: {filename}{ext}")
-            response = requests.get(url, stream=True, timeout=300)
+            response = self._session.get(url, stream=True, timeout=300)
             response.raise_for_status()
 
             # Get total size for progress
             total_size = int(response.headers.get('content-length', 0))
 
+            # Let urllib3 undo any Content-Encoding while copying from the raw stream
+            response.raw.decode_content = True
             with open(output_path, 'wb') as f:
-                downloaded = 0
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if total_size:
-                        pct = (downloaded / total_size) * 100
-                        print(f"\r  {pct:.1f}% ({downloaded / 1024 / 1024:.1f}MB)", end="", flush=True)
-
-            print()  # Newline after progress
+                sink = _ProgressWriter(f, total_size) if show_progress and total_size else f
+                shutil.copyfileobj(response.raw, sink, length=DOWNLOAD_CHUNK_SIZE)
+
+            if show_progress:
+                print()  # Newline after progress
             return output_path
 
         except Exception as e:
@@ -282,6 +337,27 @@ class AudioDownloader:
                 output_path.unlink()
             return None
 
+    def download_many(
+        self, downloads: List[Tuple[str, str]], max_workers: int = 8
+    ) -> Dict[str, Optional[Path]]:
+        """Download several audio files concurrently over the shared session
+
+        Args:
+            downloads: (url, filename) pairs
+            max_workers: Number of parallel downloads
+
+        Returns:
+            Mapping of filename to downloaded path (None if the download failed)
+        """
+        def download_quietly(item: Tuple[str, str]) -> Optional[Path]:
+            url, filename = item
+            # Interleaved progress lines from several threads would be unreadable
+            return self.download(url, filename, show_progress=False)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            paths = executor.map(download_quietly, downloads)
+            return {filename: path for (_, filename), path in zip(downloads, paths)}
+
     def cleanup(self, filename: str) -> None:
         """Delete downloaded audio file"""
         for ext in ['.mp3', '.m4a', '.wav']:
@@ -1,9 +1,11 @@
 """Transcript extraction using youtube-transcript-api"""
 
-from typing import List, Optional
-from youtube_transcript_api import YouTubeTranscriptApi
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from youtube_transcript_api import NoTranscriptFound, YouTubeTranscriptApi
 
-from ..config import config
+from ..config import get_config
 from ..models.transcript import Transcript, TranscriptSegment
 
 
@@ -16,12 +18,13 @@ class TranscriptFetcher:
         Args:
             preferred_languages: List of preferred language codes (e.g., ['en', 'es'])
         """
-        self.preferred_languages = preferred_languages or config.preferred_languages
+        self.preferred_languages = preferred_languages or get_config().preferred_languages
         self.api = YouTubeTranscriptApi()
 
         # Lazy load audio tools
         self.audio_downloader = None
         self.whisper_transcriber = None
+        self._audio_tools_lock = threading.Lock()
 
     def fetch_transcript(self, video_id: str) -> Transcript:
         """Fetch transcript for a video
@@ -33,26 +36,11 @@ class TranscriptFetcher:
             Transcript object (available=False if transcript not available)
         """
         try:
-            # Try to get transcript in preferred languages
-            transcript_data = None
-            language_used = None
-
-            # Try each preferred language
-            for lang in self.preferred_languages:
-                try:
-                    transcript_data = self.api.fetch(video_id, languages=[lang])
-                    language_used = lang
-                    break
-                except Exception:
-                    continue
-
-            # If no preferred language worked, try without language specification
-            if not transcript_data:
-                try:
-                    transcript_data = self.api.fetch(video_id)
-                    language_used = "en"
-                except Exception:
-                    pass
+            # One request lists every transcript; the language is picked locally
+            transcript_list = self.api.list(video_id)
+            transcript = self._pick_transcript(transcript_list)
+
+            transcript_data = transcript.fetch() if transcript is not None else None
 
             # If we got transcript data, parse it
             if transcript_data:
@@ -67,13 +55,13 @@ class TranscriptFetcher:
 
                 return Transcript(
                     available=True,
-                    language=language_used,
-                    is_auto_generated=True,  # API doesn't distinguish in simple mode
+                    language=transcript.language_code,
+                    is_auto_generated=transcript.is_generated,
                     segments=segments,
                 )
 
             # No YouTube transcript available - try audio fallback if enabled
-            if config.enable_audio_fallback:
+            if get_config().enable_audio_fallback:
                 print(f"No YouTube transcript for {video_id}, trying audio transcription...")
                 return self._transcribe_from_audio(video_id)
 
@@ -83,17 +71,31 @@ class TranscriptFetcher:
             # Any error - try audio fallback if enabled
             error_msg = str(e).lower()
             if "disabled" in error_msg or "no transcript" in error_msg:
-                if config.enable_audio_fallback:
+                if get_config().enable_audio_fallback:
                     print(f"Transcripts disabled for {video_id}, trying audio transcription...")
                     return self._transcribe_from_audio(video_id)
                 return Transcript(available=False)
 
             print(f"Warning: Error fetching transcript for {video_id}: {str(e)}")
-            if config.enable_audio_fallback:
+            if get_config().enable_audio_fallback:
                 print(f"Trying audio transcription fallback...")
                 return self._transcribe_from_audio(video_id)
             return Transcript(available=False)
 
+    def _pick_transcript(self, transcript_list):
+        """Choose the best transcript from a video's TranscriptList
+
+        Preferred languages win in order, then English; find_transcript
+        already prefers a manual transcript over an auto-generated one. Returns
+        None otherwise so other languages aren't passed off as a match.
+        """
+        for language_codes in (self.preferred_languages, ["en"]):
+            try:
+                return transcript_list.find_transcript(language_codes)
+            except NoTranscriptFound:
+                continue
+        return None
+
     def _transcribe_from_audio(self, video_id: str) -> Transcript:
         """Transcribe video from downloaded audio using Whisper
 
@@ -104,14 +106,15 @@ class TranscriptFetcher:
             Transcript object
         """
         try:
-            # Lazy load audio tools
-            if self.audio_downloader is None:
-                from .audio_downloader import AudioDownloader
-                self.audio_downloader = AudioDownloader()
+            # Lazy load audio tools (locked so batch workers share one instance)
+            with self._audio_tools_lock:
+                if self.audio_downloader is None:
+                    from .audio_downloader import AudioDownloader
+                    self.audio_downloader = AudioDownloader()
 
-            if self.whisper_transcriber is None:
-                from .whisper_transcriber import WhisperTranscriber
-                self.whisper_transcriber = WhisperTranscriber(model_name=config.whisper_model)
+                if self.whisper_transcriber is None:
+                    from .whisper_transcriber import WhisperTranscriber
+                    self.whisper_transcriber = WhisperTranscriber(model_name=get_config().whisper_model)
 
             # Download audio
             audio_path = self.audio_downloader.download_audio(video_id)
@@ -125,7 +128,7 @@ class TranscriptFetcher:
             )
 
             # Cleanup if configured
-            if config.cleanup_audio and audio_path:
+            if get_config().cleanup_audio and audio_path:
                 self.audio_downloader.cleanup(video_id)
 
             return transcript
@@ -164,3 +167,25 @@ class TranscriptFetcher:
                     return Transcript(available=False)
 
         return Transcript(available=False)
+
+    def fetch_transcripts_batch(
+        self, video_ids: List[str], max_workers: int = 16
+    ) -> Dict[str, Transcript]:
+        """Fetch transcripts for several videos concurrently
+
+        Transcript fetching is network-bound, so threads overlap the
+        per-video round-trips to YouTube.
+
+        Args:
+            video_ids: YouTube video IDs
+            max_workers: Number of parallel fetches
+
+        Returns:
+            Dict mapping video ID to Transcript, in input order
+        """
+        if not video_ids:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            transcripts = executor.map(self.fetch_transcript_with_retry, video_ids)
+            return dict(zip(video_ids, transcripts))
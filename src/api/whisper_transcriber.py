@@ -1,86 +1,194 @@
 """OpenAI Whisper API-based audio transcription"""
 
+import csv
+import hashlib
+import json
+import math
+import mimetypes
 import os
 import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from typing import Callable, Dict, Optional, List, Tuple
+import httpx
 from openai import OpenAI
 
 from ..models.transcript import Transcript, TranscriptSegment
 
 # OpenAI Whisper API limit is 25MB, use 24MB to be safe
 MAX_FILE_SIZE_BYTES = 24 * 1024 * 1024
-# Chunk duration in seconds (15 minutes = ~7MB at 64kbps mono)
-CHUNK_DURATION_SECONDS = 900
+# Longest chunk in seconds (20 minutes); stream-copied chunks of high-bitrate
+# sources are shortened so they stay under the upload limit
+CHUNK_DURATION_SECONDS = 1200
+# Upper bound on concurrent API requests per process, across transcribers, files and chunks
+MAX_IN_FLIGHT_REQUESTS = 8
+# In-memory windows alive at once per process, from encode start to upload end; lets
+# the next windows encode while the current ones upload without unbounded ffmpeg runs
+MAX_BUFFERED_WINDOWS = 2 * MAX_IN_FLIGHT_REQUESTS
+# Files already at or below these settings gain nothing from re-encoding
+COMPACT_MAX_BIT_RATE = 64_000
+COMPACT_MAX_SAMPLE_RATE = 16_000
+# Finished transcripts, keyed by audio content hash, model and language
+TRANSCRIPT_CACHE_DIR = Path.home() / ".cache" / "whisper_transcripts"
+# Probed durations, keyed by path, mtime and size, kept in the cache dir
+DURATION_CACHE_NAME = "durations.json"
+# Quiet, non-interactive ffmpeg using all cores; only errors reach stderr
+FFMPEG_BASE_ARGS = ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error", "-threads", "0", "-y"]
+# Mono MP3 at 64kbps, 16kHz (Whisper's native rate) - good enough for speech recognition
+SPEECH_ENCODE_ARGS = ["-ac", "1", "-ab", "64k", "-ar", "16000"]
+
+
+_client: Optional[OpenAI] = None
+_client_lock = threading.Lock()
+# Shared by every transcriber, so parallel callers can't multiply the cap
+_request_slots = threading.BoundedSemaphore(MAX_IN_FLIGHT_REQUESTS)
+_window_slots = threading.BoundedSemaphore(MAX_BUFFERED_WINDOWS)
+
+
+def _get_shared_client() -> OpenAI:
+    """Return the OpenAI client shared by every transcriber, so they reuse one connection pool"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                api_key = os.environ.get("OPENAI_API_KEY")
+                if not api_key:
+                    raise ValueError("OPENAI_API_KEY environment variable not set")
+                _client = OpenAI(
+                    api_key=api_key,
+                    http_client=httpx.Client(
+                        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                        timeout=httpx.Timeout(600.0, connect=10.0),
+                    ),
+                )
+    return _client
 
 
 class WhisperTranscriber:
     """Transcribe audio using OpenAI Whisper API"""
 
-    def __init__(self, model_name: str = "whisper-1"):
+    def __init__(self, model_name: str = "whisper-1", cache_dir: Optional[Path] = None):
         """Initialize Whisper transcriber
 
         Args:
             model_name: OpenAI Whisper model (currently only "whisper-1" available)
+            cache_dir: Directory for cached transcripts (default: ~/.cache/whisper_transcripts)
         """
         self.model_name = model_name
-        self.client = None
+        self.cache_dir = cache_dir or TRANSCRIPT_CACHE_DIR
+        self._durations: Optional[Dict[str, float]] = None
+        self._durations_lock = threading.Lock()
 
     def _get_client(self) -> OpenAI:
-        """Get or create OpenAI client"""
-        if self.client is None:
-            api_key = os.environ.get("OPENAI_API_KEY")
-            if not api_key:
-                raise ValueError("OPENAI_API_KEY environment variable not set")
-            self.client = OpenAI(api_key=api_key)
-        return self.client
-
-    def _compress_audio(self, audio_path: Path) -> Optional[Path]:
-        """Compress audio file to fit within OpenAI's 25MB limit
-
-        Uses ffmpeg to convert to mono MP3 at 64kbps (sufficient for speech).
-
-        Args:
-            audio_path: Path to original audio file
-
-        Returns:
-            Path to compressed file, or None if compression failed
-        """
-        compressed_path = audio_path.parent / f"{audio_path.stem}_compressed.mp3"
+        """Get the shared OpenAI client"""
+        return _get_shared_client()
 
+    def _probe_audio_stream(self, audio_path: Path) -> Optional[dict]:
+        """Read bit rate, channels and sample rate of the first audio stream via ffprobe"""
         try:
-            file_size_mb = audio_path.stat().st_size / (1024 * 1024)
-            print(f"Compressing audio ({file_size_mb:.1f}MB) for API upload...")
-
-            # Convert to mono MP3 at 64kbps - good enough for speech recognition
             result = subprocess.run(
                 [
-                    "ffmpeg", "-y",  # Overwrite output
-                    "-i", str(audio_path),
-                    "-ac", "1",  # Mono
-                    "-ab", "64k",  # 64kbps bitrate
-                    "-ar", "16000",  # 16kHz sample rate (Whisper's native rate)
-                    str(compressed_path)
+                    "ffprobe", "-v", "error",
+                    "-select_streams", "a:0",
+                    "-show_entries", "stream=bit_rate,channels,sample_rate:format=bit_rate",
+                    "-of", "json",
+                    str(audio_path)
                 ],
                 capture_output=True,
-                text=True
             )
-
             if result.returncode != 0:
-                print(f"FFmpeg compression failed: {result.stderr[:200]}")
                 return None
+            info = json.loads(result.stdout)
+            streams = info.get("streams") or []
+            if not streams:
+                return None
+            stream = streams[0]
+            bit_rate = stream.get("bit_rate") or info.get("format", {}).get("bit_rate")
+            return {
+                "bit_rate": int(bit_rate) if bit_rate else None,
+                "channels": int(stream.get("channels") or 0),
+                "sample_rate": int(stream.get("sample_rate") or 0),
+            }
+        except Exception:
+            return None
 
-            compressed_size_mb = compressed_path.stat().st_size / (1024 * 1024)
-            print(f"Compressed to {compressed_size_mb:.1f}MB")
+    def _needs_recompression(self, audio_path: Path) -> bool:
+        """Whether re-encoding to 64kbps mono 16kHz would actually shrink the file
 
-            return compressed_path
+        Many podcasts already ship at that quality; for those the ffmpeg pass
+        is skipped and the file is split as-is. Unknown formats are recompressed.
+        """
+        info = self._probe_audio_stream(audio_path)
+        if not info or not info["bit_rate"]:
+            return True
+        return not (
+            info["bit_rate"] <= COMPACT_MAX_BIT_RATE
+            and info["channels"] == 1
+            and 0 < info["sample_rate"] <= COMPACT_MAX_SAMPLE_RATE
+        )
 
-        except Exception as e:
-            print(f"Error compressing audio: {str(e)}")
+    def _get_audio_duration(self, audio_path: Path) -> Optional[float]:
+        """Get duration of audio file in seconds
+
+        Probed once per file version with ffprobe and remembered in
+        durations.json, so retries and re-runs skip the subprocess.
+        """
+        try:
+            stat = audio_path.stat()
+        except OSError:
             return None
+        key = f"{audio_path.resolve()}|{stat.st_mtime_ns}|{stat.st_size}"
+
+        with self._durations_lock:
+            if self._durations is None:
+                self._durations = self._load_durations()
+            if key in self._durations:
+                return self._durations[key]
+
+        duration = self._probe_duration(audio_path)
+        if duration is not None:
+            with self._durations_lock:
+                self._durations[key] = duration
+                self._save_durations()
+        return duration
+
+    def _load_durations(self) -> Dict[str, float]:
+        """Load durations probed by previous runs"""
+        try:
+            with open(self.cache_dir / DURATION_CACHE_NAME, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
 
-    def _get_audio_duration(self, audio_path: Path) -> Optional[float]:
-        """Get duration of audio file in seconds using ffprobe"""
+    def _save_durations(self) -> None:
+        """Persist probed durations for the next run
+
+        Entries other transcribers sharing the cache dir wrote since we loaded
+        are merged in first, and each save goes through its own temp file, so
+        concurrent writers neither erase nor interleave with each other.
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path = self.cache_dir / DURATION_CACHE_NAME
+            merged = self._load_durations()
+            merged.update(self._durations)
+            self._durations = merged
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.cache_dir, suffix=".tmp", delete=False
+            ) as f:
+                json.dump(merged, f)
+            try:
+                os.replace(f.name, cache_path)
+            except OSError:
+                os.unlink(f.name)
+                raise
+        except OSError as e:
+            print(f"Warning: Could not save duration cache: {str(e)}")
+
+    def _probe_duration(self, audio_path: Path) -> Optional[float]:
+        """Read the container duration with ffprobe"""
         try:
             result = subprocess.run(
                 [
@@ -98,108 +206,177 @@ class WhisperTranscriber:
             pass
         return None
 
-    def _split_audio(self, audio_path: Path) -> List[Path]:
-        """Split audio file into chunks of CHUNK_DURATION_SECONDS"""
+    def _split_audio(self, audio_path: Path) -> List[Tuple[Path, float]]:
+        """Split audio into chunks without re-encoding
+
+        Uses ffmpeg's segment muxer with stream copy, so the split is a single
+        pass with no decode and no quality loss. Chunk length is capped so each
+        chunk stays under the upload limit at the source bitrate.
+
+        Returns:
+            List of (chunk path, start offset in seconds), in order
+        """
         duration = self._get_audio_duration(audio_path)
         if not duration:
             print("Could not determine audio duration")
             return []
 
-        chunks = []
-        chunk_num = 0
-        start_time = 0
+        bytes_per_second = audio_path.stat().st_size / duration
+        chunk_seconds = max(1, min(
+            CHUNK_DURATION_SECONDS,
+            int(MAX_FILE_SIZE_BYTES * 0.9 / bytes_per_second),
+        ))
 
-        num_chunks = int(duration // CHUNK_DURATION_SECONDS) + (1 if duration % CHUNK_DURATION_SECONDS > 0 else 0)
+        num_chunks = math.ceil(duration / chunk_seconds)
         print(f"Splitting {duration/60:.1f} min audio into {num_chunks} chunks...")
 
-        while start_time < duration:
-            chunk_path = audio_path.parent / f"{audio_path.stem}_chunk{chunk_num}.mp3"
+        chunk_pattern = audio_path.parent / f"{audio_path.stem}_chunk%03d{audio_path.suffix}"
+        list_path = audio_path.parent / f"{audio_path.stem}_chunks.csv"
 
+        try:
             result = subprocess.run(
                 [
-                    "ffmpeg", "-y",
+                    *FFMPEG_BASE_ARGS,
                     "-i", str(audio_path),
-                    "-ss", str(start_time),
-                    "-t", str(CHUNK_DURATION_SECONDS),
-                    "-ac", "1",  # Mono
-                    "-ab", "64k",  # 64kbps
-                    "-ar", "16000",  # 16kHz
-                    str(chunk_path)
+                    "-map", "0:a",
+                    "-c", "copy",
+                    "-f", "segment",
+                    "-segment_time", str(chunk_seconds),
+                    "-reset_timestamps", "1",
+                    "-segment_list", str(list_path),
+                    "-segment_list_type", "csv",
+                    str(chunk_pattern)
                 ],
-                capture_output=True,
-                text=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
             )
 
-            if result.returncode == 0 and chunk_path.exists():
-                chunks.append(chunk_path)
-            else:
-                print(f"Failed to create chunk {chunk_num}")
-                break
+            chunks = []
+            if list_path.exists():
+                # Each row is "filename,start,end"; actual cut points land on
+                # packet boundaries, so offsets come from here, not chunk_seconds
+                with open(list_path, newline="") as f:
+                    for row in csv.reader(f):
+                        if len(row) >= 2:
+                            chunks.append((audio_path.parent / Path(row[0]).name, float(row[1])))
 
-            start_time += CHUNK_DURATION_SECONDS
-            chunk_num += 1
+            if result.returncode != 0 or not chunks:
+                stderr = result.stderr.decode(errors="replace")
+                print(f"FFmpeg split failed: {stderr[:200]}")
+                for chunk_path, _ in chunks:
+                    chunk_path.unlink(missing_ok=True)
+                return []
 
-        return chunks
+            return chunks
+
+        finally:
+            list_path.unlink(missing_ok=True)
+
+    def _encode_window(self, audio_path: Path, start: float, seconds: float) -> bytes:
+        """Encode one window of the source for speech, straight into memory
+
+        Seeking before -i makes ffmpeg decode only this window, so running one
+        of these per chunk still decodes the source exactly once overall.
+        """
+        result = subprocess.run(
+            [
+                *FFMPEG_BASE_ARGS,
+                "-ss", str(start),
+                "-t", str(seconds),
+                "-i", str(audio_path),
+                "-map", "0:a",
+                *SPEECH_ENCODE_ARGS,
+                "-f", "mp3",
+                "pipe:1"
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        if result.returncode != 0 or not result.stdout:
+            stderr = result.stderr.decode(errors="replace")
+            raise RuntimeError(f"FFmpeg encoding failed: {stderr[:200]}")
+        return result.stdout
 
     def _transcribe_single_file(self, audio_path: Path, language: Optional[str] = None) -> Optional[tuple]:
         """Transcribe a single audio file, returns (segments, language) or None"""
+        # Hand the SDK an open handle (never a Path, which it would read into
+        # memory) so httpx streams the multipart body from disk
+        content_type = mimetypes.guess_type(audio_path.name)[0] or "application/octet-stream"
+        with open(audio_path, "rb") as audio_file:
+            return self._transcribe_upload((audio_path.name, audio_file, content_type), language)
+
+    def _transcribe_upload(self, upload: tuple, language: Optional[str] = None) -> tuple:
+        """Send one (filename, content, content type) upload, returns (segments, language)"""
         client = self._get_client()
 
-        with open(audio_path, "rb") as audio_file:
+        with _request_slots:
             response = client.audio.transcriptions.create(
                 model=self.model_name,
-                file=audio_file,
+                file=upload,
                 language=language,
                 response_format="verbose_json",
                 timestamp_granularities=["segment"]
             )
 
-        segments = []
-        for seg in response.segments or []:
-            segments.append(
-                TranscriptSegment(
-                    text=seg.text.strip(),
-                    start=seg.start,
-                    duration=seg.end - seg.start,
-                )
-            )
+        segment_cls = TranscriptSegment
+        segments = [
+            segment_cls(text=seg.text.strip(), start=seg.start, duration=seg.end - seg.start)
+            for seg in response.segments or ()
+        ]
 
         return segments, response.language or language or "en"
 
-    def _transcribe_chunks(self, chunks: List[Path], language: Optional[str] = None) -> Transcript:
-        """Transcribe multiple chunks and merge with adjusted timestamps"""
-        all_segments = []
-        detected_language = language or "en"
-        time_offset = 0.0
+    def _transcribe_chunks(
+        self,
+        offsets: List[float],
+        transcribe_chunk: Callable[[int], Optional[tuple]],
+        language: Optional[str] = None,
+    ) -> Transcript:
+        """Transcribe chunks concurrently and merge with adjusted timestamps
 
-        for i, chunk_path in enumerate(chunks):
-            print(f"Transcribing chunk {i+1}/{len(chunks)}: {chunk_path.name}")
+        If any chunk fails the whole transcript is reported unavailable, so a
+        partial result is never cached.
 
+        Args:
+            offsets: Start offset in seconds of each chunk, in order
+            transcribe_chunk: Transcribes chunk i, returning (segments, language)
+            language: Requested language, used if no chunk reports one
+        """
+
+        def run(i: int) -> Optional[tuple]:
+            print(f"Transcribing chunk {i+1}/{len(offsets)}")
             try:
-                result = self._transcribe_single_file(chunk_path, language)
+                result = transcribe_chunk(i)
                 if result:
-                    segments, lang = result
-                    detected_language = lang
+                    print(f"  Chunk {i+1}: {len(result[0])} segments")
+                return result
+            except Exception as e:
+                print(f"  Error transcribing chunk {i+1}: {str(e)}")
+                return None
 
-                    # Adjust timestamps for this chunk
-                    for seg in segments:
-                        all_segments.append(
-                            TranscriptSegment(
-                                text=seg.text,
-                                start=seg.start + time_offset,
-                                duration=seg.duration,
-                            )
-                        )
+        # Fan every chunk out at once; the shared _request_slots semaphore caps what is in flight
+        with ThreadPoolExecutor(max_workers=min(len(offsets), MAX_IN_FLIGHT_REQUESTS)) as executor:
+            results = list(executor.map(run, range(len(offsets))))
 
-                    print(f"  Chunk {i+1}: {len(segments)} segments")
+        # A transcript with a missing window would be cached as a success and never retried
+        failed = [i + 1 for i, result in enumerate(results) if result is None]
+        if failed:
+            print(f"Chunks {failed} failed to transcribe")
+            return Transcript(available=False)
 
-            except Exception as e:
-                print(f"  Error transcribing chunk {i+1}: {str(e)}")
+        all_segments = []
+        detected_language = language or "en"
+        segment_cls = TranscriptSegment
 
-            # Update offset for next chunk
-            time_offset += CHUNK_DURATION_SECONDS
+        for time_offset, (segments, detected_language) in zip(offsets, results):
 
-        print(f"Transcription complete: {len(all_segments)} total segments from {len(chunks)} chunks")
+            # Adjust timestamps for this chunk
+            all_segments.extend([
+                segment_cls(text=seg.text, start=seg.start + time_offset, duration=seg.duration)
+                for seg in segments
+            ])
+
+        print(f"Transcription complete: {len(all_segments)} total segments from {len(offsets)} chunks")
 
         return Transcript(
             available=len(all_segments) > 0,
@@ -208,11 +385,91 @@ class WhisperTranscriber:
             segments=all_segments,
         )
 
+    def _transcribe_split(self, audio_path: Path, language: Optional[str] = None) -> Transcript:
+        """Split audio losslessly on disk, transcribe the chunks and remove them"""
+        chunks = self._split_audio(audio_path)
+        if not chunks:
+            return Transcript(available=False)
+
+        try:
+            return self._transcribe_chunks(
+                [offset for _, offset in chunks],
+                lambda i: self._transcribe_single_file(chunks[i][0], language),
+                language,
+            )
+        finally:
+            # Clean up all chunk files
+            for chunk_path, _ in chunks:
+                try:
+                    chunk_path.unlink(missing_ok=True)
+                except Exception:
+                    pass
+
+    def _transcribe_encoded(self, audio_path: Path, language: Optional[str] = None) -> Transcript:
+        """Re-encode audio for speech window by window and upload from memory
+
+        Each worker encodes its own 20-minute window to an in-memory MP3 (about
+        10MB at 64kbps) and uploads it, so encoding overlaps with uploads and
+        no chunk files touch the disk.
+        """
+        duration = self._get_audio_duration(audio_path)
+        if not duration:
+            print("Could not determine audio duration")
+            return Transcript(available=False)
+
+        num_chunks = math.ceil(duration / CHUNK_DURATION_SECONDS)
+        print(f"Re-encoding {duration/60:.1f} min audio into {num_chunks} chunks...")
+        offsets = [float(i * CHUNK_DURATION_SECONDS) for i in range(num_chunks)]
+
+        def transcribe_window(i: int) -> tuple:
+            # Held until the upload finishes, bounding both ffmpeg runs and buffered MP3s
+            with _window_slots:
+                data = self._encode_window(audio_path, offsets[i], CHUNK_DURATION_SECONDS)
+                upload = (f"{audio_path.stem}_chunk{i:03d}.mp3", data, "audio/mpeg")
+                return self._transcribe_upload(upload, language)
+
+        return self._transcribe_chunks(offsets, transcribe_window, language)
+
+    def _cache_path(self, audio_path: Path, language: Optional[str]) -> Path:
+        """Cache file for this audio content, model and language
+
+        blake2b is used because only content identity matters and it hashes
+        large files faster than SHA-256.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        with open(audio_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        return self.cache_dir / f"{h.hexdigest()}_{self.model_name}_{language or 'auto'}.json"
+
+    def _load_cached(self, cache_path: Path) -> Optional[Transcript]:
+        """Load a cached transcript, or None if missing or unreadable"""
+        try:
+            return Transcript.model_validate_json(cache_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable transcript cache {cache_path.name}: {str(e)}")
+            return None
+
+    def _save_cached(self, cache_path: Path, transcript: Transcript) -> None:
+        """Write a transcript to the cache atomically"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            tmp_path.write_text(transcript.model_dump_json(), encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"Warning: Could not cache transcript: {str(e)}")
+
     def transcribe_audio(
         self, audio_path: Path, language: Optional[str] = None
     ) -> Transcript:
         """Transcribe audio file using OpenAI Whisper API
 
+        Results are cached on disk by audio content, so re-running the same
+        file returns the stored transcript without another API call.
+
         Args:
             audio_path: Path to audio file
             language: Language code (e.g., 'en', 'es') or None for auto-detect
@@ -220,72 +477,39 @@ class WhisperTranscriber:
         Returns:
             Transcript object with segments
         """
-        compressed_path = None
         try:
-            client = self._get_client()
-
-            # Check file size and compress if needed
-            file_size = audio_path.stat().st_size
-            upload_path = audio_path
-
-            if file_size > MAX_FILE_SIZE_BYTES:
-                compressed_path = self._compress_audio(audio_path)
-                if compressed_path and compressed_path.exists():
-                    # Verify compressed file is under limit
-                    if compressed_path.stat().st_size <= MAX_FILE_SIZE_BYTES:
-                        upload_path = compressed_path
-                    else:
-                        # Compressed file still too large - split into chunks
-                        print(f"Compressed file still too large, splitting into chunks...")
-                        chunks = self._split_audio(audio_path)
-                        if chunks:
-                            try:
-                                return self._transcribe_chunks(chunks, language)
-                            finally:
-                                # Clean up all chunk files
-                                for chunk in chunks:
-                                    try:
-                                        if chunk.exists():
-                                            chunk.unlink()
-                                    except Exception:
-                                        pass
-                                # Clean up compressed file
-                                if compressed_path.exists():
-                                    compressed_path.unlink()
-                        else:
-                            print(f"Failed to split audio into chunks")
-                            if compressed_path.exists():
-                                compressed_path.unlink()
-                            return Transcript(available=False)
-                else:
-                    print(f"Compression failed, skipping...")
-                    return Transcript(available=False)
-
-            print(f"Transcribing audio via OpenAI API: {upload_path.name}")
-
-            # Open audio file and send to OpenAI
-            with open(upload_path, "rb") as audio_file:
-                # Use verbose_json to get timestamps
-                response = client.audio.transcriptions.create(
-                    model=self.model_name,
-                    file=audio_file,
-                    language=language,
-                    response_format="verbose_json",
-                    timestamp_granularities=["segment"]
-                )
+            cache_path = self._cache_path(audio_path, language)
+        except Exception as e:
+            print(f"Error reading audio file {audio_path}: {str(e)}")
+            return Transcript(available=False)
 
-            # Convert to our format
-            segments = []
-            for seg in response.segments or []:
-                segments.append(
-                    TranscriptSegment(
-                        text=seg.text.strip(),
-                        start=seg.start,
-                        duration=seg.end - seg.start,
-                    )
-                )
+        cached = self._load_cached(cache_path)
+        if cached is not None:
+            print(f"Using cached transcript for {audio_path.name}")
+            return cached
+
+        transcript = self._transcribe_uncached(audio_path, language)
+        if transcript.available:
+            self._save_cached(cache_path, transcript)
+        return transcript
+
+    def _transcribe_uncached(
+        self, audio_path: Path, language: Optional[str] = None
+    ) -> Transcript:
+        """Transcribe audio via the API, re-encoding or splitting it as needed"""
+        try:
+            self._get_client()  # Fail before any ffmpeg work if no API key is set
+
+            if audio_path.stat().st_size > MAX_FILE_SIZE_BYTES:
+                # Already-compact audio is split losslessly; anything else is
+                # re-encoded window by window in memory
+                if self._needs_recompression(audio_path):
+                    return self._transcribe_encoded(audio_path, language)
+                return self._transcribe_split(audio_path, language)
 
-            detected_language = response.language or language or "en"
+            print(f"Transcribing audio via OpenAI API: {audio_path.name}")
+
+            segments, detected_language = self._transcribe_single_file(audio_path, language)
 
             print(f"Transcription complete: {len(segments)} segments")
 
@@ -300,10 +524,28 @@ class WhisperTranscriber:
             print(f"Error transcribing audio via OpenAI API: {str(e)}")
             return Transcript(available=False)
 
-        finally:
-            # Clean up compressed file if we created one
-            if compressed_path and compressed_path.exists():
-                try:
-                    compressed_path.unlink()
-                except Exception:
-                    pass
+    def transcribe_many(
+        self,
+        audio_paths: List[Path],
+        language: Optional[str] = None,
+        max_workers: int = MAX_IN_FLIGHT_REQUESTS,
+    ) -> Dict[Path, Transcript]:
+        """Transcribe several audio files concurrently
+
+        API calls are network-bound, so files are transcribed on a thread
+        pool; requests from all files and their chunks, and from any other
+        transcriber in the process, share the MAX_IN_FLIGHT_REQUESTS limit.
+
+        Args:
+            audio_paths: Paths to audio files
+            language: Language code or None for auto-detect
+            max_workers: Number of files processed at once
+
+        Returns:
+            Mapping of audio path to Transcript, in input order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            transcripts = executor.map(
+                lambda path: self.transcribe_audio(path, language), audio_paths
+            )
+            return dict(zip(audio_paths, transcripts))
@@ -1,13 +1,41 @@
 """YouTube Data API v3 client"""
 
+import re
+import threading
 import time
+import httplib2
 import isodate
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
-from ..config import config
+from ..config import get_config
+
+# URL/ID patterns, compiled once rather than on every extract_* call
+_VIDEO_ID_RE = re.compile(r'^[a-zA-Z0-9_-]{11}$')
+_VIDEO_URL_RES = (
+    re.compile(r'(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]{11})'),  # Standard and short URLs
+    re.compile(r'youtube\.com/embed/([a-zA-Z0-9_-]{11})'),  # Embed URLs
+    re.compile(r'youtube\.com/v/([a-zA-Z0-9_-]{11})'),  # Old style URLs
+)
+_PLAYLIST_LIST_RE = re.compile(r'[?&]list=([a-zA-Z0-9_-]+)')
+# The PT#H#M#S subset YouTube uses for nearly every video duration
+_PT_RE = re.compile(r'^PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?$')
+
+
+def _parse_iso_duration(duration_iso: str) -> int:
+    """Parse a YouTube ISO 8601 duration to whole seconds
+
+    Handles the common PT#H#M#S form directly and falls back to isodate
+    for anything else (e.g. day components on very long streams).
+    """
+    match = _PT_RE.match(duration_iso)
+    if match:
+        hours, minutes, seconds = match.groups(default="0")
+        return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+    return int(isodate.parse_duration(duration_iso).total_seconds())
 
 
 class YouTubeClient:
@@ -48,14 +76,39 @@ class YouTubeClient:
         "43": "Trailers",
     }
 
+    # Minimum spacing between API requests issued by concurrent batch workers
+    MIN_REQUEST_INTERVAL = 0.1
+
     def __init__(self, api_key: Optional[str] = None):
         """Initialize YouTube API client
 
         Args:
             api_key: YouTube Data API key. If not provided, uses config.
         """
-        self.api_key = api_key or config.youtube_api_key
+        self.api_key = api_key or get_config().youtube_api_key
         self.youtube = build("youtube", "v3", developerKey=self.api_key)
+        # httplib2 connections aren't thread-safe, so worker threads get their own
+        self._local = threading.local()
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+        # channel_id -> uploads playlist ID
+        self._uploads_cache: Dict[str, str] = {}
+
+    def _thread_http(self) -> httplib2.Http:
+        """Return this thread's HTTP connection, creating it on first use"""
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._local.http = httplib2.Http(timeout=60)
+        return http
+
+    def _wait_for_request_slot(self) -> None:
+        """Space requests MIN_REQUEST_INTERVAL apart across all threads"""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + self.MIN_REQUEST_INTERVAL
+        if wait > 0:
+            time.sleep(wait)
 
     def get_channel_info(self, channel_id: str) -> Dict[str, Any]:
         """Get channel metadata
@@ -72,7 +125,7 @@ class YouTubeClient:
         """
         try:
             request = self.youtube.channels().list(
-                part="snippet,statistics,topicDetails",
+                part="snippet,statistics,topicDetails,contentDetails",
                 id=channel_id,
             )
             response = request.execute()
@@ -81,6 +134,13 @@ class YouTubeClient:
                 raise ValueError(f"Channel not found: {channel_id}")
 
             channel_data = response["items"][0]
+            uploads = (
+                channel_data.get("contentDetails", {})
+                .get("relatedPlaylists", {})
+                .get("uploads")
+            )
+            if uploads:
+                self._uploads_cache[channel_id] = uploads
             snippet = channel_data["snippet"]
             statistics = channel_data.get("statistics", {})
             topic_details = channel_data.get("topicDetails", {})
@@ -111,14 +171,46 @@ class YouTubeClient:
                 )
             raise
 
+    def _get_uploads_playlist_id(self, channel_id: str) -> str:
+        """Resolve a channel's uploads playlist ID, caching the result
+
+        Raises:
+            ValueError: If channel not found
+            HttpError: If API request fails
+        """
+        uploads_playlist_id = self._uploads_cache.get(channel_id)
+        if uploads_playlist_id:
+            return uploads_playlist_id
+
+        if channel_id.startswith("UC") and len(channel_id) == 24:
+            # The uploads playlist of channel UCxxx is always UUxxx
+            uploads_playlist_id = "UU" + channel_id[2:]
+        else:
+            request = self.youtube.channels().list(part="contentDetails", id=channel_id)
+            response = request.execute()
+
+            if not response.get("items"):
+                raise ValueError(f"Channel not found: {channel_id}")
+
+            uploads_playlist_id = response["items"][0]["contentDetails"][
+                "relatedPlaylists"
+            ]["uploads"]
+
+        self._uploads_cache[channel_id] = uploads_playlist_id
+        return uploads_playlist_id
+
     def get_channel_videos(
-        self, channel_id: str, max_results: Optional[int] = None
+        self,
+        channel_id: str,
+        max_results: Optional[int] = None,
+        uploads_playlist_id: Optional[str] = None,
     ) -> List[str]:
         """Get all video IDs from a channel
 
         Args:
             channel_id: YouTube channel ID
             max_results: Maximum number of videos to retrieve (None for all)
+            uploads_playlist_id: The channel's uploads playlist, if already known
 
         Returns:
             List of video IDs
@@ -127,54 +219,77 @@ class YouTubeClient:
             ValueError: If channel not found
             HttpError: If API request fails
         """
+        uploads_playlist_id = uploads_playlist_id or self._get_uploads_playlist_id(
+            channel_id
+        )
+
+        # Paginate through all videos in the uploads playlist
+        try:
+            return self._collect_video_ids(uploads_playlist_id, max_results)
+        except HttpError as e:
+            # A derived uploads playlist 404s when the channel doesn't exist
+            if e.resp.status == 404:
+                raise ValueError(f"Channel not found: {channel_id}")
+            raise
+
+    def _collect_video_ids(
+        self, playlist_id: str, max_results: Optional[int]
+    ) -> List[str]:
+        """Gather video IDs from a playlist, stopping once max_results is met"""
         video_ids = []
-        page_token = None
+        for items in self._iter_playlist_pages(playlist_id, max_results):
+            if max_results:
+                items = items[: max_results - len(video_ids)]
+            video_ids.extend(item["contentDetails"]["videoId"] for item in items)
+            if max_results and len(video_ids) >= max_results:
+                break
+        return video_ids
 
-        # First, get the uploads playlist ID
-        request = self.youtube.channels().list(part="contentDetails", id=channel_id)
-        response = request.execute()
+    def _iter_playlist_pages(
+        self, playlist_id: str, limit: Optional[int] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield each page of playlist items, prefetching the next page
 
-        if not response.get("items"):
-            raise ValueError(f"Channel not found: {channel_id}")
+        As soon as a page's nextPageToken is known the following request is
+        started on a background thread, so it is in flight while the caller
+        handles the current page. Once `limit` items have been fetched no
+        further page is requested, so stopping early wastes no quota.
 
-        uploads_playlist_id = response["items"][0]["contentDetails"][
-            "relatedPlaylists"
-        ]["uploads"]
+        Raises:
+            HttpError: If an API request fails
+        """
 
-        # Paginate through all videos in the uploads playlist
-        while True:
+        def fetch(page_token: Optional[str]) -> Dict[str, Any]:
             request = self.youtube.playlistItems().list(
                 part="contentDetails",
-                playlistId=uploads_playlist_id,
+                playlistId=playlist_id,
                 maxResults=50,  # Maximum allowed per request
                 pageToken=page_token,
             )
-            response = request.execute()
-
-            # Extract video IDs
-            for item in response.get("items", []):
-                video_id = item["contentDetails"]["videoId"]
-                video_ids.append(video_id)
-
-                # Check if we've reached max_results
-                if max_results and len(video_ids) >= max_results:
-                    return video_ids[:max_results]
-
-            # Check for next page
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
-
-            # Rate limiting
-            time.sleep(0.1)
-
-        return video_ids
-
-    def get_video_details(self, video_ids: List[str]) -> List[Dict[str, Any]]:
+            return request.execute(http=self._thread_http())
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(fetch, None)
+            fetched = 0
+            while future is not None:
+                response = future.result()
+                items = response.get("items", [])
+                fetched += len(items)
+                page_token = response.get("nextPageToken")
+                if not page_token or (limit and fetched >= limit):
+                    future = None
+                else:
+                    future = executor.submit(fetch, page_token)
+                yield items
+
+    def get_video_details(
+        self, video_ids: List[str], http: Optional[httplib2.Http] = None
+    ) -> List[Dict[str, Any]]:
         """Get detailed metadata for videos
 
         Args:
             video_ids: List of video IDs (max 50 per call)
+            http: Connection to send the request on (default: the client's own)
 
         Returns:
             List of video metadata dictionaries
@@ -194,45 +309,47 @@ class YouTubeClient:
                 part="snippet,contentDetails,statistics",
                 id=",".join(video_ids),
             )
-            response = request.execute()
+            response = request.execute(http=http)
+
+            # Bind hot lookups to locals once per response
+            category_name = self.CATEGORY_NAMES.get
+            parse_duration = _parse_iso_duration
+            from_iso = datetime.fromisoformat
 
             videos = []
             for item in response.get("items", []):
                 snippet = item["snippet"]
                 content_details = item["contentDetails"]
                 statistics = item.get("statistics", {})
+                status = item.get("status", {})
+                category_id = snippet["categoryId"]
 
                 # Parse ISO 8601 duration (may be missing for live streams/premieres)
                 duration_iso = content_details.get("duration")
                 if not duration_iso:
                     # Skip videos without duration (live streams, etc.)
                     continue
-                duration = isodate.parse_duration(duration_iso)
-                duration_seconds = int(duration.total_seconds())
+                duration_seconds = parse_duration(duration_iso)
 
                 video_data = {
                     "id": item["id"],
                     "title": snippet["title"],
                     "description": snippet.get("description", ""),
-                    "published_at": datetime.fromisoformat(
-                        snippet["publishedAt"].replace("Z", "+00:00")
-                    ),
+                    "published_at": from_iso(snippet["publishedAt"].replace("Z", "+00:00")),
                     "duration_seconds": duration_seconds,
                     "duration_iso": duration_iso,
-                    "view_count": int(statistics.get("viewCount", 0)),
-                    "like_count": int(statistics.get("likeCount", 0)),
-                    "comment_count": int(statistics.get("commentCount", 0)),
+                    "view_count": int(statistics.get("viewCount") or 0),
+                    "like_count": int(statistics.get("likeCount") or 0),
+                    "comment_count": int(statistics.get("commentCount") or 0),
                     "thumbnail_url": snippet["thumbnails"]["high"]["url"],
                     "tags": snippet.get("tags", []),
-                    "category_id": snippet["categoryId"],
-                    "category_name": self.CATEGORY_NAMES.get(snippet["categoryId"]),
+                    "category_id": category_id,
+                    "category_name": category_name(category_id),
                     "default_language": snippet.get("defaultLanguage"),
                     "default_audio_language": snippet.get("defaultAudioLanguage"),
                     "license": content_details.get("license", "youtube"),
-                    "privacy_status": item.get("status", {}).get("privacyStatus"),
-                    "made_for_kids": item.get("status", {}).get(
-                        "madeForKids", False
-                    ),
+                    "privacy_status": status.get("privacyStatus"),
+                    "made_for_kids": status.get("madeForKids", False),
                 }
                 videos.append(video_data)
 
@@ -246,27 +363,32 @@ class YouTubeClient:
             raise
 
     def get_video_details_batch(
-        self, video_ids: List[str], batch_size: int = 50
+        self, video_ids: List[str], batch_size: int = 50, max_workers: int = 5
     ) -> List[Dict[str, Any]]:
-        """Get video details in batches
+        """Get video details in batches, fetching batches concurrently
 
         Args:
             video_ids: List of video IDs
             batch_size: Batch size (max 50)
+            max_workers: Number of batches in flight at once
 
         Returns:
-            List of all video metadata dictionaries
+            List of all video metadata dictionaries, in input order
         """
-        all_videos = []
+        batches = [
+            video_ids[i : i + batch_size] for i in range(0, len(video_ids), batch_size)
+        ]
+        if not batches:
+            return []
 
-        for i in range(0, len(video_ids), batch_size):
-            batch = video_ids[i : i + batch_size]
-            videos = self.get_video_details(batch)
-            all_videos.extend(videos)
+        def fetch(batch: List[str]) -> List[Dict[str, Any]]:
+            self._wait_for_request_slot()
+            return self.get_video_details(batch, http=self._thread_http())
 
-            # Rate limiting between batches
-            if i + batch_size < len(video_ids):
-                time.sleep(0.2)
+        all_videos = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for videos in executor.map(fetch, batches):
+                all_videos.extend(videos)
 
         return all_videos
 
@@ -322,21 +444,13 @@ class YouTubeClient:
         Raises:
             ValueError: If video ID cannot be extracted
         """
-        import re
-
         # Already a video ID (11 characters, alphanumeric + - and _)
-        if re.match(r'^[a-zA-Z0-9_-]{11}$', video_input):
+        if _VIDEO_ID_RE.match(video_input):
             return video_input
 
         # Extract from various YouTube URL formats
-        patterns = [
-            r'(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]{11})',  # Standard and short URLs
-            r'youtube\.com/embed/([a-zA-Z0-9_-]{11})',  # Embed URLs
-            r'youtube\.com/v/([a-zA-Z0-9_-]{11})',  # Old style URLs
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, video_input)
+        for pattern in _VIDEO_URL_RES:
+            match = pattern.search(video_input)
             if match:
                 return match.group(1)
 
@@ -358,15 +472,13 @@ class YouTubeClient:
         Raises:
             ValueError: If playlist ID cannot be extracted
         """
-        import re
-
         # Already a playlist ID (starts with PL)
         if playlist_input.startswith("PL") and len(playlist_input) > 10:
             return playlist_input
 
         # Extract from URL (list= parameter)
         if "youtube.com" in playlist_input or "youtu.be" in playlist_input:
-            match = re.search(r'[?&]list=([a-zA-Z0-9_-]+)', playlist_input)
+            match = _PLAYLIST_LIST_RE.search(playlist_input)
             if match:
                 playlist_id = match.group(1)
                 if playlist_id.startswith("PL"):
@@ -393,45 +505,15 @@ class YouTubeClient:
             ValueError: If playlist not found
             HttpError: If API request fails
         """
-        video_ids = []
-        page_token = None
-
         # Paginate through all videos in the playlist
-        while True:
-            try:
-                request = self.youtube.playlistItems().list(
-                    part="contentDetails",
-                    playlistId=playlist_id,
-                    maxResults=50,  # Maximum allowed per request
-                    pageToken=page_token,
+        try:
+            return self._collect_video_ids(playlist_id, max_results)
+        except HttpError as e:
+            if e.resp.status == 404:
+                raise ValueError(f"Playlist not found: {playlist_id}")
+            elif e.resp.status == 403:
+                raise ValueError(
+                    "API quota exceeded or playlist is private. "
+                    "Please check your API key and playlist permissions."
                 )
-                response = request.execute()
-
-                # Extract video IDs
-                for item in response.get("items", []):
-                    video_id = item["contentDetails"]["videoId"]
-                    video_ids.append(video_id)
-
-                    # Check if we've reached max_results
-                    if max_results and len(video_ids) >= max_results:
-                        return video_ids[:max_results]
-
-                # Check for next page
-                page_token = response.get("nextPageToken")
-                if not page_token:
-                    break
-
-                # Rate limiting
-                time.sleep(0.1)
-
-            except HttpError as e:
-                if e.resp.status == 404:
-                    raise ValueError(f"Playlist not found: {playlist_id}")
-                elif e.resp.status == 403:
-                    raise ValueError(
-                        "API quota exceeded or playlist is private. "
-                        "Please check your API key and playlist permissions."
-                    )
-                raise
-
-        return video_ids
+            raise
@@ -2,6 +2,7 @@
 
 import os
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 from dotenv import load_dotenv
@@ -17,8 +18,10 @@ class Config:
     """Application configuration"""
 
     def __init__(self):
+        env = os.environ
+
         # API Configuration
-        self.youtube_api_key = os.getenv("YOUTUBE_API_KEY", "")
+        self.youtube_api_key = env.get("YOUTUBE_API_KEY", "")
         if not self.youtube_api_key:
             raise ValueError(
                 "YOUTUBE_API_KEY not found in environment variables. "
@@ -26,37 +29,37 @@ class Config:
             )
 
         # Processing Configuration
-        self.max_concurrent_videos = int(os.getenv("MAX_CONCURRENT_VIDEOS", "5"))
+        self.max_concurrent_videos = int(env.get("MAX_CONCURRENT_VIDEOS", "5"))
 
         # Output Configuration
-        self.output_dir = Path(os.getenv("OUTPUT_DIR", "./output"))
+        self.output_dir = Path(env.get("OUTPUT_DIR", "./output"))
 
         # Transcript Configuration
         self.preferred_languages = self._parse_languages(
-            os.getenv("PREFERRED_LANGUAGES", "en,en-US,en-GB")
+            env.get("PREFERRED_LANGUAGES", "en,en-US,en-GB")
         )
         self.fallback_to_auto_generated = self._parse_bool(
-            os.getenv("FALLBACK_TO_AUTO_GENERATED", "true")
+            env.get("FALLBACK_TO_AUTO_GENERATED", "true")
         )
 
         # API Retry Configuration
-        self.retry_attempts = int(os.getenv("RETRY_ATTEMPTS", "3"))
-        self.retry_delay_seconds = int(os.getenv("RETRY_DELAY_SECONDS", "2"))
-        self.timeout_seconds = int(os.getenv("TIMEOUT_SECONDS", "30"))
+        self.retry_attempts = int(env.get("RETRY_ATTEMPTS", "3"))
+        self.retry_delay_seconds = int(env.get("RETRY_DELAY_SECONDS", "2"))
+        self.timeout_seconds = int(env.get("TIMEOUT_SECONDS", "30"))
 
         # Audio Transcription Fallback
         self.enable_audio_fallback = self._parse_bool(
-            os.getenv("ENABLE_AUDIO_FALLBACK", "false")
+            env.get("ENABLE_AUDIO_FALLBACK", "false")
         )
-        self.whisper_model = os.getenv("WHISPER_MODEL", "whisper-1")
+        self.whisper_model = env.get("WHISPER_MODEL", "whisper-1")
         self.cleanup_audio = self._parse_bool(
-            os.getenv("CLEANUP_AUDIO", "true")
+            env.get("CLEANUP_AUDIO", "true")
         )
 
         # Log configuration (without exposing secrets)
         logger.info("Configuration loaded successfully")
-        logger.debug(f"Output directory: {self.output_dir}")
-        logger.debug(f"Max concurrent videos: {self.max_concurrent_videos}")
+        logger.debug("Output directory: %s", self.output_dir)
+        logger.debug("Max concurrent videos: %s", self.max_concurrent_videos)
 
     def _parse_languages(self, lang_str: str) -> List[str]:
         """Parse comma-separated language codes"""
@@ -78,5 +81,14 @@ class Config:
             raise ValueError("At least one preferred language must be specified")
 
 
-# Global configuration instance
-config = Config()
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the global configuration, loading it on first use"""
+    return Config()
+
+
+def __getattr__(name: str):
+    # Keeps `from src.config import config` working without loading at import
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,11 +5,7 @@ from typing import Optional
 import typer
 from rich.console import Console
 
-from .api.youtube_client import YouTubeClient
-from .processors.video_processor import VideoProcessor
-from .storage.json_writer import JSONWriter
-from .config import config
-from .models import ErrorEntry
+from .config import get_config
 
 app = typer.Typer(
     name="youtube-transcript-extractor",
@@ -44,6 +40,10 @@ def extract(
         python -m src.main extract -c UCxxxxxx -o my_output.json --max-videos 10
     """
     try:
+        from .api.youtube_client import YouTubeClient
+        from .processors.video_processor import VideoProcessor
+        from .storage.json_writer import JSONWriter
+
         # Validate inputs
         if not channel_id and not channel_url:
             console.print(
@@ -63,7 +63,7 @@ def extract(
 
         # Set default output path
         if output is None:
-            output = config.output_dir / "channel_transcripts.json"
+            output = get_config().output_dir / "channel_transcripts.json"
 
         # Show configuration
         console.print("\n[bold cyan]YouTube Transcript Extractor[/bold cyan]")
@@ -111,6 +111,8 @@ def validate(
     Example:
         python -m src.main validate output/channel_transcripts.json
     """
+    from .storage.json_writer import JSONWriter
+
     console.print(f"\n[bold cyan]Validating:[/bold cyan] {output}")
     console.print("")
 
@@ -147,6 +149,9 @@ def video(
         python -m src.main video -u "https://www.youtube.com/watch?v=DIC-E6W4QBw" -o my_video.json
     """
     try:
+        from .api.youtube_client import YouTubeClient
+        from .processors.video_processor import VideoProcessor
+
         # Validate inputs
         if not video_id and not video_url:
             console.print(
@@ -166,7 +171,7 @@ def video(
 
         # Set default output path
         if output is None:
-            output = config.output_dir / f"video_{video_id}.json"
+            output = get_config().output_dir / f"video_{video_id}.json"
 
         # Show configuration
         console.print("\n[bold cyan]YouTube Video Transcript Extractor[/bold cyan]")
@@ -279,6 +284,10 @@ def playlist(
         python -m src.main playlist -u "PLAYLIST_URL" --max-videos 10
     """
     try:
+        from .api.youtube_client import YouTubeClient
+        from .processors.video_processor import VideoProcessor
+        from .models import ErrorEntry
+
         # Validate inputs
         if not playlist_id and not playlist_url:
             console.print(
@@ -298,7 +307,7 @@ def playlist(
 
         # Set default output path
         if output is None:
-            output = config.output_dir / f"playlist_{playlist_id}.json"
+            output = get_config().output_dir / f"playlist_{playlist_id}.json"
 
         # Show configuration
         console.print("\n[bold cyan]YouTube Playlist Transcript Extractor[/bold cyan]")
@@ -337,9 +346,11 @@ def playlist(
         from datetime import datetime, timezone
         from tqdm import tqdm
 
-        videos = []
-        errors = []
+        # Models are dumped as they're produced, so the output needs no second pass
+        video_dumps = []
+        error_dumps = []
         successful_count = 0
+        process_video = processor.process_video
 
         console.print(f"Processing {len(video_ids)} videos...")
         for video_id in tqdm(video_ids, desc="Processing videos", unit="video"):
@@ -349,31 +360,31 @@ def playlist(
 
                 if not video_data:
                     # Video not found in metadata (might be private/deleted)
-                    errors.append(
+                    error_dumps.append(
                         ErrorEntry(
                             video_id=video_id,
                             error_type="VideoNotFound",
                             error_message="Video metadata not available (private or deleted)",
-                        )
+                        ).model_dump(mode="json")
                     )
                     continue
 
                 # Process video
-                video = processor.process_video(video_data)
-                videos.append(video)
+                video = process_video(video_data)
+                video_dumps.append(video.model_dump(mode="json"))
 
                 if video.transcript.available:
                     successful_count += 1
 
             except Exception as e:
                 # Log error and continue
-                errors.append(
+                error_dumps.append(
                     ErrorEntry(
                         video_id=video_id,
                         video_title=video_data.get("title") if video_data else None,
                         error_type=type(e).__name__,
                         error_message=str(e),
-                    )
+                    ).model_dump(mode="json")
                 )
                 console.print(f"\nError processing video {video_id}: {str(e)}")
 
@@ -387,8 +398,8 @@ def playlist(
                 "successful_extractions": successful_count,
                 "failed_extractions": len(video_ids) - successful_count,
             },
-            "videos": [v.model_dump(mode="json") for v in videos],
-            "errors": [e.model_dump(mode="json") for e in errors],
+            "videos": video_dumps,
+            "errors": error_dumps,
         }
 
         # Write output
@@ -406,7 +417,7 @@ def playlist(
         console.print(f"Playlist ID: {playlist_id}")
         console.print(f"Videos Processed: {len(video_ids)}")
         console.print(f"Transcripts Extracted: {successful_count}")
-        console.print(f"Failed Extractions: {len(errors)}")
+        console.print(f"Failed Extractions: {len(error_dumps)}")
         console.print("=" * 60)
 
         # Success
@@ -471,7 +482,7 @@ def podcast(
             # Sanitize podcast title for filename
             safe_title = re.sub(r'[^\w\s-]', '', podcast_info.title)
             safe_title = re.sub(r'\s+', '_', safe_title)[:50]
-            output = config.output_dir / f"podcast_{safe_title}.json"
+            output = get_config().output_dir / f"podcast_{safe_title}.json"
 
         # Load existing data if skip_existing is enabled
         existing_guids = set()
@@ -3,10 +3,14 @@ set -e
 
 echo "Starting Bill AI Machine (Flask)..."
 
+# One process keeps the RAG caches and refresh state shared; SSE chat streams
+# spend their time waiting on Claude, so each holds a cheap thread, not a worker.
+
 exec gunicorn server:app \
     --bind "0.0.0.0:${PORT:-8080}" \
     --workers 1 \
-    --threads 4 \
+    --worker-class gthread \
+    --threads "${GUNICORN_THREADS:-32}" \
     --timeout 120 \
     --keep-alive 65 \
     --log-level info \
@@ -34,14 +34,22 @@ class TestConfigParsing:
         assert c.enable_audio_fallback is False
 
     def test_missing_api_key_raises(self):
-        # The module-level `config = Config()` fires during reload,
-        # so the ValueError is raised at import/reload time.
+        # Config is loaded lazily, so the ValueError surfaces on first use
         with patch("dotenv.load_dotenv"):
             with patch.dict(os.environ, {}, clear=True):
                 from importlib import reload
                 import src.config as cfg_mod
+                reload(cfg_mod)
                 with pytest.raises(ValueError, match="YOUTUBE_API_KEY"):
-                    reload(cfg_mod)
+                    cfg_mod.get_config()
+
+    def test_get_config_is_cached(self):
+        with patch.dict(os.environ, {"YOUTUBE_API_KEY": "test-key-123"}):
+            from importlib import reload
+            import src.config as cfg_mod
+            reload(cfg_mod)
+            assert cfg_mod.get_config() is cfg_mod.get_config()
+            assert cfg_mod.config is cfg_mod.get_config()
 
     def test_custom_languages(self):
         c = self._make_config({"PREFERRED_LANGUAGES": "es,fr"})
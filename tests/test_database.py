@@ -50,6 +50,19 @@ class TestDatabase:
         assert msgs[0]["content"] == "Hello"
         assert msgs[1]["role"] == "assistant"
 
+    def test_add_messages_batch(self, _patch_db):
+        db = _patch_db
+        first = db.create_conversation("First")
+        second = db.create_conversation("Second")
+        db.add_messages([
+            (first, "user", "Q1"),
+            (second, "user", "Q2"),
+            (first, "assistant", "A1"),
+        ])
+
+        assert [m["content"] for m in db.get_conversation_messages(first)] == ["Q1", "A1"]
+        assert [m["content"] for m in db.get_conversation_messages(second)] == ["Q2"]
+
     def test_update_title(self, _patch_db):
         db = _patch_db
         cid = db.create_conversation("Old Title")
@@ -1,5 +1,6 @@
 """Tests for PodcastFetcher with mocked HTTP requests."""
 
+import io
 import os
 from unittest.mock import patch, MagicMock
 
@@ -39,6 +40,18 @@ SAMPLE_RSS = """<?xml version="1.0" encoding="UTF-8"?>
 """
 
 
+class _RawStream(io.BytesIO):
+    """Stand-in for urllib3's raw response stream."""
+    decode_content = False
+
+
+def _mock_response(body: bytes):
+    mock_resp = MagicMock()
+    mock_resp.raw = _RawStream(body)
+    mock_resp.raise_for_status = MagicMock()
+    return mock_resp
+
+
 def _make_fetcher():
     with patch.dict(os.environ, {"YOUTUBE_API_KEY": "test-key"}):
         from importlib import reload
@@ -51,11 +64,9 @@ def _make_fetcher():
 class TestPodcastFetcher:
     def test_fetch_feed(self):
         fetcher = _make_fetcher()
-        mock_resp = MagicMock()
-        mock_resp.content = SAMPLE_RSS.encode("utf-8")
-        mock_resp.raise_for_status = MagicMock()
+        mock_resp = _mock_response(SAMPLE_RSS.encode("utf-8"))
 
-        with patch("src.api.podcast_fetcher.requests.get", return_value=mock_resp):
+        with patch.object(fetcher._session, "get", return_value=mock_resp):
             podcast, episodes = fetcher.fetch_feed()
 
         assert podcast.title == "Test Podcast"
@@ -66,11 +77,9 @@ class TestPodcastFetcher:
 
     def test_episode_parsing(self):
         fetcher = _make_fetcher()
-        mock_resp = MagicMock()
-        mock_resp.content = SAMPLE_RSS.encode("utf-8")
-        mock_resp.raise_for_status = MagicMock()
+        mock_resp = _mock_response(SAMPLE_RSS.encode("utf-8"))
 
-        with patch("src.api.podcast_fetcher.requests.get", return_value=mock_resp):
+        with patch.object(fetcher._session, "get", return_value=mock_resp):
             _, episodes = fetcher.fetch_feed()
 
         ep1 = episodes[0]
@@ -83,11 +92,9 @@ class TestPodcastFetcher:
 
     def test_html_stripped_from_description(self):
         fetcher = _make_fetcher()
-        mock_resp = MagicMock()
-        mock_resp.content = SAMPLE_RSS.encode("utf-8")
-        mock_resp.raise_for_status = MagicMock()
+        mock_resp = _mock_response(SAMPLE_RSS.encode("utf-8"))
 
-        with patch("src.api.podcast_fetcher.requests.get", return_value=mock_resp):
+        with patch.object(fetcher._session, "get", return_value=mock_resp):
             _, episodes = fetcher.fetch_feed()
 
         # Episode 2 has HTML in description
@@ -105,20 +112,72 @@ class TestPodcastFetcher:
           </channel>
         </rss>"""
         fetcher = _make_fetcher()
-        mock_resp = MagicMock()
-        mock_resp.content = rss.encode("utf-8")
-        mock_resp.raise_for_status = MagicMock()
+        mock_resp = _mock_response(rss.encode("utf-8"))
 
-        with patch("src.api.podcast_fetcher.requests.get", return_value=mock_resp):
+        with patch.object(fetcher._session, "get", return_value=mock_resp):
             _, episodes = fetcher.fetch_feed()
         assert len(episodes) == 0
 
     def test_invalid_rss_raises(self):
         fetcher = _make_fetcher()
-        mock_resp = MagicMock()
-        mock_resp.content = b"<rss><not-channel/></rss>"
-        mock_resp.raise_for_status = MagicMock()
+        mock_resp = _mock_response(b"<rss><not-channel/></rss>")
 
-        with patch("src.api.podcast_fetcher.requests.get", return_value=mock_resp):
+        with patch.object(fetcher._session, "get", return_value=mock_resp):
             with pytest.raises(ValueError, match="no channel"):
                 fetcher.fetch_feed()
+
+    def test_streams_response_body(self):
+        fetcher = _make_fetcher()
+        mock_resp = _mock_response(SAMPLE_RSS.encode("utf-8"))
+
+        with patch.object(fetcher._session, "get", return_value=mock_resp) as mock_get:
+            fetcher.fetch_feed()
+
+        assert mock_get.call_args.kwargs["stream"] is True
+        assert mock_resp.raw.decode_content is True
+        mock_resp.close.assert_called_once()
+
+
+class TestAudioDownloader:
+    def test_download_many(self, tmp_path):
+        _make_fetcher()
+        from src.api.podcast_fetcher import AudioDownloader
+
+        downloader = AudioDownloader(output_dir=tmp_path)
+
+        def fake_get(url, stream=True, timeout=None):
+            if "missing" in url:
+                raise Exception("404")
+            resp = MagicMock()
+            resp.headers = {"content-length": "5"}
+            resp.raw = _RawStream(url.encode()[-5:])
+            return resp
+
+        with patch.object(downloader._session, "get", side_effect=fake_get):
+            results = downloader.download_many([
+                ("https://example.com/ep1.mp3", "ep1"),
+                ("https://example.com/missing.mp3", "missing"),
+                ("https://example.com/ep2.m4a", "ep2"),
+            ], max_workers=2)
+
+        assert results["ep1"] == tmp_path / "ep1.mp3"
+        assert results["ep2"] == tmp_path / "ep2.m4a"
+        assert results["missing"] is None
+        assert (tmp_path / "ep1.mp3").read_bytes() == b"1.mp3"
+        assert not (tmp_path / "missing.mp3").exists()
+
+    def test_download_reports_progress(self, tmp_path, capsys):
+        _make_fetcher()
+        from src.api.podcast_fetcher import AudioDownloader
+
+        downloader = AudioDownloader(output_dir=tmp_path)
+        resp = MagicMock()
+        resp.headers = {"content-length": "4"}
+        resp.raw = _RawStream(b"data")
+
+        with patch.object(downloader._session, "get", return_value=resp):
+            path = downloader.download("https://example.com/ep.mp3", "ep")
+
+        assert path.read_bytes() == b"data"
+        assert resp.raw.decode_content is True
+        assert "100.0%" in capsys.readouterr().out
@@ -0,0 +1,261 @@
+"""Tests for rag.py retrieval helpers with mocked Pinecone and Cohere."""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import rag
+
+
+def _match(i, score):
+    return SimpleNamespace(id=f"chunk{i}", score=score, metadata={"text": f"text {i}"})
+
+
+def _matches(n=12):
+    # Spread out and below the confident-top threshold, so rerank isn't skipped
+    return [_match(i, 0.7 - i * 0.02) for i in range(n)]
+
+
+@pytest.fixture
+def search_env():
+    """Mock clients and embeddings for search_knowledge_base, with an empty cache."""
+    index = MagicMock()
+    index.query.return_value = SimpleNamespace(matches=_matches())
+    with patch.object(rag, "_search_cache", rag.QueryCache(max_size=16)), \
+            patch.object(rag, "get_clients", return_value=(None, None, index, None)), \
+            patch.object(rag, "get_embeddings", side_effect=lambda qs: [[0.0]] * len(qs)), \
+            patch.object(rag, "log_retrieval_metrics"):
+        yield index
+
+
+def _rerank_response(n):
+    return SimpleNamespace(results=[SimpleNamespace(index=i, relevance_score=0.9 - i * 0.01) for i in range(n)])
+
+
+class TestSearchCache:
+    def test_caches_successful_search(self, search_env):
+        with patch.object(rag, "_cohere_rerank", return_value=_rerank_response(10)) as rerank:
+            first = rag.search_knowledge_base("how do I rank")
+            second = rag.search_knowledge_base("how do I rank")
+
+        assert [m.id for m in second] == [m.id for m in first]
+        assert rerank.call_count == 1
+
+    def test_rerank_failure_is_not_cached(self, search_env):
+        with patch.object(rag, "_cohere_rerank", side_effect=RuntimeError("cohere down")):
+            degraded = rag.search_knowledge_base("how do I rank")
+        assert len(degraded) == rag.RERANK_TOP_K
+
+        with patch.object(rag, "_cohere_rerank", return_value=_rerank_response(10)) as rerank:
+            rag.search_knowledge_base("how do I rank")
+        assert rerank.call_count == 1
+
+    def test_partial_pinecone_results_are_not_cached(self, search_env):
+        search_env.query.side_effect = [RuntimeError("timeout")] + [
+            SimpleNamespace(matches=_matches())
+        ] * 10
+        with patch.object(rag, "expand_query", return_value=("how do I rank", "how do I rank seo")), \
+                patch.object(rag, "_cohere_rerank", return_value=_rerank_response(10)):
+            results = rag.search_knowledge_base("how do I rank")
+
+        assert results
+        assert len(rag._search_cache) == 0
+
+    def test_top_k_is_part_of_the_key(self, search_env):
+        with patch.object(rag, "_cohere_rerank", return_value=_rerank_response(10)) as rerank:
+            rag.search_knowledge_base("how do I rank", top_k=25)
+            rag.search_knowledge_base("how do I rank", top_k=12)
+        assert rerank.call_count == 2
+
+
+class TestEmbeddingCache:
+    def test_ram_hit_returns_cached_list_without_fetching(self):
+        vector = [0.25, -0.5, 1.0]
+        with patch.object(rag, "_embedding_cache", rag.QueryCache(max_size=16)), \
+                patch.object(rag, "_disk_cache_get", return_value={}), \
+                patch.object(rag, "_disk_cache_put"), \
+                patch.object(rag, "_fetch_embeddings", return_value=[vector]) as fetch:
+            first = rag.get_embeddings(["query"])[0]
+            second = rag.get_embeddings(["query"])[0]
+
+        assert fetch.call_count == 1
+        assert first == vector
+        assert second is first
+
+    def test_int8_round_trip(self):
+        vector = [0.5, -0.25, 0.0, 0.125]
+        restored = rag._dequantize(*rag._quantize(vector))
+        assert restored == pytest.approx(vector, abs=0.5 / 127)
+
+
+@pytest.fixture
+def fresh_log(tmp_path):
+    """Point the retrieval log at a temp file with no writer running yet."""
+    with patch.object(rag, "RETRIEVAL_LOG_PATH", str(tmp_path / "retrieval_log.jsonl")), \
+            patch.object(rag, "_log_queue", rag.queue.Queue()), \
+            patch.object(rag, "_log_writer_thread", None), \
+            patch.object(rag, "_log_disabled", False):
+        yield tmp_path / "retrieval_log.jsonl"
+
+
+class TestRetrievalLog:
+    def test_exit_flush_writes_queued_records(self, fresh_log):
+        for i in range(50):
+            rag.log_retrieval_metrics({"query": f"q{i}"})
+        rag._flush_retrieval_log()
+
+        lines = fresh_log.read_bytes().splitlines()
+        assert [rag.orjson.loads(line)["query"] for line in lines] == [f"q{i}" for i in range(50)]
+        assert not rag._log_writer_thread.is_alive()
+
+    def test_open_failure_stops_queueing(self, fresh_log):
+        with patch.object(rag, "RETRIEVAL_LOG_PATH", str(fresh_log.parent / "missing" / "log.jsonl")):
+            rag.log_retrieval_metrics({"query": "first"})
+            rag._log_writer_thread.join(timeout=5)
+            rag.log_retrieval_metrics({"query": "second"})
+
+        assert rag._log_disabled is True
+        assert rag._log_queue.empty()
+
+
+def _chunk(chunk_id, text, source="seo_podcast", episode="Episode"):
+    return SimpleNamespace(
+        id=chunk_id,
+        score=0.5,
+        metadata={"source": source, "episode_title": episode, "text": text},
+    )
+
+
+class TestBuildPrompt:
+    @pytest.fixture(autouse=True)
+    def no_takeaways(self):
+        with patch.object(rag, "search_takeaways", return_value=[]):
+            yield
+
+    def test_estimate_tokens(self):
+        assert rag.estimate_tokens("") == 0
+        assert rag.estimate_tokens("one two three") == 4
+
+    def test_packs_chunks_until_budget(self):
+        chunks = [_chunk(f"c{i}", " ".join(["word"] * 30)) for i in range(5)]
+        with patch.object(rag, "MAX_CONTEXT_TOKENS", 100):
+            _, messages, _ = rag.build_prompt("q", chunks, [])
+
+        context_block = messages[-1]["content"][0]["text"]
+        # Each chunk is ~44 tokens with its header, so only two fit in 100
+        assert context_block.count("[Source ") == 2
+
+    def test_first_chunk_is_kept_even_over_budget(self):
+        chunks = [_chunk("c0", " ".join(["word"] * 500))]
+        with patch.object(rag, "MAX_CONTEXT_TOKENS", 10):
+            _, messages, _ = rag.build_prompt("q", chunks, [])
+        assert messages[-1]["content"][0]["text"].count("[Source ") == 1
+
+    def test_context_is_emitted_in_chunk_id_order(self):
+        chunks = [_chunk("c3", "third"), _chunk("c1", "first"), _chunk("c2", "second")]
+        _, messages, _ = rag.build_prompt("q", chunks, [])
+
+        context_block = messages[-1]["content"][0]["text"]
+        assert context_block.index("first") < context_block.index("second") < context_block.index("third")
+
+        reordered = [_chunk("c1", "first"), _chunk("c2", "second"), _chunk("c3", "third")]
+        _, same, _ = rag.build_prompt("q", reordered, [])
+        assert same[-1]["content"][0]["text"] == context_block
+
+    def test_cache_breakpoint_sits_on_the_context_block(self):
+        history = [{"role": "user", "content": f"m{i}"} for i in range(25)]
+        system_prompt, messages, _ = rag.build_prompt("the question", [_chunk("c1", "body")], history)
+
+        assert system_prompt == rag.SYSTEM_PROMPT
+        assert [m["content"] for m in messages[:-1]] == [f"m{i}" for i in range(5, 25)]
+        context, question = messages[-1]["content"]
+        assert context["cache_control"] == {"type": "ephemeral"}
+        assert "body" in context["text"]
+        assert "cache_control" not in question
+        assert "the question" in question["text"]
+
+    def test_system_prompt_is_sent_as_cached_block(self):
+        anthropic = MagicMock()
+        anthropic.messages.stream.return_value.__enter__.return_value.text_stream = iter(["a", "b"])
+        with patch.object(rag, "get_clients", return_value=(None, anthropic, None, None)):
+            assert list(rag.stream_response("sys", [])) == ["a", "b"]
+
+        system = anthropic.messages.stream.call_args.kwargs["system"]
+        assert system == [{"type": "text", "text": "sys", "cache_control": {"type": "ephemeral"}}]
+
+
+class TestRerankSkipReason:
+    def test_too_few_candidates(self):
+        assert rag._rerank_skip_reason([_match(i, 0.9 - i * 0.1) for i in range(3)])
+
+    def test_tied_scores(self):
+        assert rag._rerank_skip_reason([_match(i, 0.6 - i * 0.001) for i in range(12)])
+
+    def test_confident_top_hit(self):
+        matches = [_match(i, 0.9 - i * 0.004) for i in range(10)] + [_match(10, 0.4)]
+        assert rag._rerank_skip_reason(matches)
+
+    def test_spread_out_candidates_are_reranked(self):
+        assert rag._rerank_skip_reason(_matches()) is None
+
+
+class TestCohereRerankCoalescing:
+    def _run_leader_and_follower(self, rerank):
+        """Start a leader whose Cohere call blocks, then a follower for the same key."""
+        release = threading.Event()
+        cohere = MagicMock()
+
+        def blocking_rerank(**kwargs):
+            release.wait(5)
+            return rerank()
+
+        cohere.rerank.side_effect = blocking_rerank
+        outcomes = {}
+
+        def call(name):
+            try:
+                outcomes[name] = rag._cohere_rerank("q", ["d1", "d2"])
+            except BaseException as e:
+                outcomes[name] = e
+
+        with patch.object(rag, "get_clients", return_value=(None, None, None, cohere)):
+            leader = threading.Thread(target=call, args=("leader",))
+            leader.start()
+            while ("q", ("d1", "d2")) not in rag._rerank_inflight:
+                time.sleep(0.001)
+            follower = threading.Thread(target=call, args=("follower",))
+            follower.start()
+            time.sleep(0.1)  # Let the follower park on the leader's future
+            release.set()
+            leader.join(5)
+            follower.join(5)
+
+        assert not follower.is_alive()
+        assert not rag._rerank_inflight
+        return cohere, outcomes
+
+    def test_followers_share_the_leader_response(self):
+        response = object()
+        cohere, outcomes = self._run_leader_and_follower(lambda: response)
+        assert cohere.rerank.call_count == 1
+        assert outcomes["leader"] is response
+        assert outcomes["follower"] is response
+
+    def test_followers_get_the_leader_error(self):
+        def fail():
+            raise RuntimeError("cohere down")
+
+        _, outcomes = self._run_leader_and_follower(fail)
+        assert isinstance(outcomes["leader"], RuntimeError)
+        assert outcomes["follower"] is outcomes["leader"]
+
+    def test_followers_are_released_when_leader_is_interrupted(self):
+        def interrupt():
+            raise KeyboardInterrupt
+
+        _, outcomes = self._run_leader_and_follower(interrupt)
+        assert isinstance(outcomes["leader"], KeyboardInterrupt)
+        assert isinstance(outcomes["follower"], RuntimeError)
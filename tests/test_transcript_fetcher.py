@@ -19,6 +19,32 @@ def _make_fetcher():
         return fetcher, MockApi
 
 
+def _mock_transcript(language_code, snippets, is_generated=True):
+    transcript = MagicMock()
+    transcript.language_code = language_code
+    transcript.is_generated = is_generated
+    transcript.fetch.return_value = snippets
+    return transcript
+
+
+class _FakeTranscriptList:
+    """Minimal stand-in for youtube_transcript_api's TranscriptList."""
+
+    def __init__(self, transcripts):
+        self._transcripts = transcripts
+
+    def __iter__(self):
+        return iter(self._transcripts)
+
+    def find_transcript(self, language_codes):
+        from youtube_transcript_api import NoTranscriptFound
+        for code in language_codes:
+            for transcript in self._transcripts:
+                if transcript.language_code == code:
+                    return transcript
+        raise NoTranscriptFound("vid123", language_codes, self)
+
+
 class TestFetchTranscript:
     def test_success(self):
         fetcher, MockApi = _make_fetcher()
@@ -34,25 +60,28 @@ class TestFetchTranscript:
         snippet2.start = 2.0
         snippet2.duration = 1.5
 
-        fetcher.api.fetch.return_value = [snippet1, snippet2]
+        fetcher.api.list.return_value = _FakeTranscriptList(
+            [_mock_transcript("en", [snippet1, snippet2], is_generated=False)]
+        )
 
         result = fetcher.fetch_transcript("vid123")
         assert result.available is True
         assert result.language == "en"
+        assert result.is_auto_generated is False
         assert len(result.segments) == 2
         assert result.full_text == "Hello world. Goodbye."
 
     def test_no_transcript_returns_unavailable(self):
         fetcher, MockApi = _make_fetcher()
-        fetcher.api.fetch.side_effect = Exception("No transcript")
+        fetcher.api.list.side_effect = Exception("No transcript")
 
         with patch.object(type(fetcher), '_TranscriptFetcher__class__', create=True):
             # Ensure audio fallback is disabled
-            with patch("src.api.transcript_fetcher.config") as mock_config:
-                mock_config.enable_audio_fallback = False
-                mock_config.preferred_languages = ["en"]
+            with patch("src.api.transcript_fetcher.get_config") as mock_get_config:
+                mock_get_config.return_value.enable_audio_fallback = False
+                mock_get_config.return_value.preferred_languages = ["en"]
                 fetcher_fresh, _ = _make_fetcher()
-                fetcher_fresh.api.fetch.side_effect = Exception("No transcript available")
+                fetcher_fresh.api.list.side_effect = Exception("No transcript available")
                 result = fetcher_fresh.fetch_transcript("vid123")
                 assert result.available is False
 
@@ -60,23 +89,48 @@ class TestFetchTranscript:
         fetcher, MockApi = _make_fetcher()
         fetcher.preferred_languages = ["es", "en"]
 
-        call_count = 0
+        snippet = MagicMock()
+        snippet.text = "Hello"
+        snippet.start = 0.0
+        snippet.duration = 1.0
+        english = _mock_transcript("en", [snippet])
+        french = _mock_transcript("fr", [snippet])
 
-        def side_effect(video_id, languages=None):
-            nonlocal call_count
-            call_count += 1
-            if languages == ["es"]:
-                raise Exception("Not found")
-            snippet = MagicMock()
-            snippet.text = "Hello"
-            snippet.start = 0.0
-            snippet.duration = 1.0
-            return [snippet]
-
-        fetcher.api.fetch.side_effect = side_effect
+        fetcher.api.list.return_value = _FakeTranscriptList([french, english])
         result = fetcher.fetch_transcript("vid123")
         assert result.available is True
-        assert call_count == 2  # es failed, en succeeded
+        assert result.language == "en"  # es missing, en preferred over fr
+        fetcher.api.list.assert_called_once_with("vid123")
+        english.fetch.assert_called_once()
+        french.fetch.assert_not_called()
+
+    def test_falls_back_to_english(self):
+        fetcher, MockApi = _make_fetcher()
+        fetcher.preferred_languages = ["de"]
+
+        snippet = MagicMock()
+        snippet.text = "Hello"
+        snippet.start = 0.0
+        snippet.duration = 1.0
+
+        fetcher.api.list.return_value = _FakeTranscriptList([_mock_transcript("en", [snippet])])
+        result = fetcher.fetch_transcript("vid123")
+        assert result.available is True
+        assert result.language == "en"
+
+    def test_ignores_other_languages(self):
+        fetcher, MockApi = _make_fetcher()
+        fetcher.preferred_languages = ["en"]
+
+        spanish = _mock_transcript("es", [MagicMock()])
+        fetcher.api.list.return_value = _FakeTranscriptList([spanish])
+
+        with patch("src.api.transcript_fetcher.get_config") as mock_get_config:
+            mock_get_config.return_value.enable_audio_fallback = False
+            result = fetcher.fetch_transcript("vid123")
+
+        assert result.available is False
+        spanish.fetch.assert_not_called()
 
 
 class TestFetchTranscriptWithRetry:
@@ -117,3 +171,23 @@ class TestFetchTranscriptWithRetry:
         with patch("time.sleep"):
             result = fetcher.fetch_transcript_with_retry("vid123", max_retries=2)
         assert result.available is False
+
+
+class TestFetchTranscriptsBatch:
+    def test_returns_transcripts_by_video_id(self):
+        fetcher, MockApi = _make_fetcher()
+        from src.models.transcript import Transcript
+
+        def mock_fetch(video_id, max_retries=3):
+            return Transcript(available=video_id != "missing")
+
+        fetcher.fetch_transcript_with_retry = mock_fetch
+
+        results = fetcher.fetch_transcripts_batch(["a", "missing", "b"], max_workers=2)
+        assert list(results) == ["a", "missing", "b"]
+        assert results["a"].available is True
+        assert results["missing"].available is False
+
+    def test_empty_batch(self):
+        fetcher, MockApi = _make_fetcher()
+        assert fetcher.fetch_transcripts_batch([]) == {}
@@ -141,6 +141,16 @@ class TestParsePubDate:
         assert result is not None
         assert result.year == 2024
 
+    def test_rfc2822_timezone_name(self):
+        result = self.parse_pub_date("Mon, 15 Jan 2024 12:00:00 GMT")
+        assert result is not None
+        assert result.hour == 12
+
+    def test_iso_datetime_with_z(self):
+        result = self.parse_pub_date("2024-01-15T12:00:00Z")
+        assert result is not None
+        assert result.utcoffset().total_seconds() == 0
+
     def test_empty(self):
         assert self.parse_pub_date("") is None
 
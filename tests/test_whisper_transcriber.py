@@ -0,0 +1,72 @@
+"""Tests for src/api/whisper_transcriber.py with mocked ffmpeg and API."""
+
+from unittest.mock import patch
+
+from src.api.whisper_transcriber import CHUNK_DURATION_SECONDS, WhisperTranscriber
+from src.models.transcript import TranscriptSegment
+
+
+def _make_transcriber(tmp_path):
+    """Create a WhisperTranscriber with a large audio file and a temp cache."""
+    audio_path = tmp_path / "episode.mp3"
+    audio_path.write_bytes(b"\0" * 1024)
+    transcriber = WhisperTranscriber(cache_dir=tmp_path / "cache")
+    return transcriber, audio_path
+
+
+class TestTranscribeAudioChunks:
+    def _transcribe(self, transcriber, audio_path, upload):
+        # Any file counts as oversized, so it goes through the chunked path
+        with patch("src.api.whisper_transcriber.MAX_FILE_SIZE_BYTES", 0), \
+                patch.object(transcriber, "_get_client"), \
+                patch.object(transcriber, "_needs_recompression", return_value=True), \
+                patch.object(transcriber, "_get_audio_duration", return_value=3 * CHUNK_DURATION_SECONDS), \
+                patch.object(transcriber, "_encode_window", return_value=b"mp3"), \
+                patch.object(transcriber, "_transcribe_upload", side_effect=upload):
+            return transcriber.transcribe_audio(audio_path, language="en")
+
+    def test_merges_chunks_and_caches(self, tmp_path):
+        transcriber, audio_path = _make_transcriber(tmp_path)
+
+        def upload(upload, language):
+            return [TranscriptSegment(text="hi", start=1.0, duration=1.0)], "en"
+
+        result = self._transcribe(transcriber, audio_path, upload)
+
+        assert result.available is True
+        assert [s.start for s in result.segments] == [
+            1.0, CHUNK_DURATION_SECONDS + 1.0, 2 * CHUNK_DURATION_SECONDS + 1.0
+        ]
+        assert list((tmp_path / "cache").glob("*.json"))
+
+    def test_failed_chunk_is_unavailable_and_not_cached(self, tmp_path):
+        transcriber, audio_path = _make_transcriber(tmp_path)
+
+        def upload(upload, language):
+            if "chunk001" in upload[0]:
+                raise RuntimeError("rate limited")
+            return [TranscriptSegment(text="hi", start=1.0, duration=1.0)], "en"
+
+        result = self._transcribe(transcriber, audio_path, upload)
+
+        assert result.available is False
+        assert not list((tmp_path / "cache").glob("*.json"))
+
+
+class TestDurationCache:
+    def test_save_merges_entries_from_other_transcribers(self, tmp_path):
+        first = WhisperTranscriber(cache_dir=tmp_path)
+        second = WhisperTranscriber(cache_dir=tmp_path)
+        first._durations = {}
+        second._durations = {}
+
+        first._durations["a|1|1"] = 10.0
+        first._save_durations()
+        second._durations["b|1|1"] = 20.0
+        second._save_durations()
+
+        assert WhisperTranscriber(cache_dir=tmp_path)._load_durations() == {
+            "a|1|1": 10.0,
+            "b|1|1": 20.0,
+        }
+        assert not list(tmp_path.glob("*.tmp"))
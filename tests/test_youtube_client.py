@@ -150,3 +150,115 @@ class TestGetVideoDetailsBatch:
 
         # Should have been called twice (50 + 25)
         assert mock_yt.videos().list.call_count >= 2
+
+    def test_batches_keep_input_order(self):
+        client, mock_yt = _make_client()
+
+        def make_item(video_id):
+            return {
+                "id": video_id,
+                "snippet": {
+                    "title": video_id,
+                    "publishedAt": "2024-01-15T12:00:00Z",
+                    "thumbnails": {"high": {"url": "https://example.com/v.jpg"}},
+                    "categoryId": "22",
+                },
+                "contentDetails": {"duration": "PT1M"},
+            }
+
+        def list_videos(part, id):
+            request = MagicMock()
+            request.execute.return_value = {"items": [make_item(v) for v in id.split(",")]}
+            return request
+
+        mock_yt.videos.return_value.list.side_effect = list_videos
+        video_ids = [f"v{i:03d}" for i in range(120)]
+
+        with patch("time.sleep"):
+            videos = client.get_video_details_batch(video_ids, batch_size=50, max_workers=3)
+
+        assert [v["id"] for v in videos] == video_ids
+
+
+class TestGetChannelVideos:
+    def test_derives_uploads_playlist_from_channel_id(self):
+        client, mock_yt = _make_client()
+        mock_yt.playlistItems().list().execute.return_value = {
+            "items": [{"contentDetails": {"videoId": "a"}}],
+        }
+        mock_yt.playlistItems.return_value.list.reset_mock()
+
+        assert client.get_channel_videos("UCtest123456789012345678") == ["a"]
+        mock_yt.channels.return_value.list.assert_not_called()
+        assert (
+            mock_yt.playlistItems.return_value.list.call_args.kwargs["playlistId"]
+            == "UUtest123456789012345678"
+        )
+
+    def test_looks_up_uploads_playlist_once(self):
+        client, mock_yt = _make_client()
+        mock_yt.channels().list().execute.return_value = {
+            "items": [{"contentDetails": {"relatedPlaylists": {"uploads": "UUlegacy"}}}],
+        }
+        mock_yt.channels.return_value.list.reset_mock()
+        mock_yt.playlistItems().list().execute.return_value = {"items": []}
+
+        client.get_channel_videos("legacy")
+        client.get_channel_videos("legacy")
+
+        assert mock_yt.channels.return_value.list.call_count == 1
+
+
+class TestGetPlaylistVideos:
+    def test_follows_page_tokens(self):
+        client, mock_yt = _make_client()
+        pages = {
+            None: {"items": [{"contentDetails": {"videoId": "a"}}], "nextPageToken": "p2"},
+            "p2": {"items": [{"contentDetails": {"videoId": "b"}}], "nextPageToken": "p3"},
+            "p3": {"items": [{"contentDetails": {"videoId": "c"}}]},
+        }
+
+        def list_items(part, playlistId, maxResults, pageToken):
+            request = MagicMock()
+            request.execute.return_value = pages[pageToken]
+            return request
+
+        mock_yt.playlistItems.return_value.list.side_effect = list_items
+
+        assert client.get_playlist_videos("PLtest") == ["a", "b", "c"]
+
+        mock_yt.playlistItems.return_value.list.reset_mock()
+        assert client.get_playlist_videos("PLtest", max_results=2) == ["a", "b"]
+        # The third page is never requested once the limit is met
+        assert mock_yt.playlistItems.return_value.list.call_count == 2
+
+        mock_yt.playlistItems.return_value.list.reset_mock()
+        assert client.get_playlist_videos("PLtest", max_results=1) == ["a"]
+        assert mock_yt.playlistItems.return_value.list.call_count == 1
+
+    def test_http_404(self):
+        from googleapiclient.errors import HttpError
+        client, mock_yt = _make_client()
+        resp = MagicMock()
+        resp.status = 404
+        mock_yt.playlistItems().list().execute.side_effect = HttpError(resp, b"not found")
+
+        with pytest.raises(ValueError, match="Playlist not found"):
+            client.get_playlist_videos("PLmissing")
+
+
+class TestParseIsoDuration:
+    def test_pt_forms(self):
+        _make_client()
+        from src.api.youtube_client import _parse_iso_duration
+
+        assert _parse_iso_duration("PT3M32S") == 212
+        assert _parse_iso_duration("PT1H2M3S") == 3723
+        assert _parse_iso_duration("PT1H") == 3600
+
+    def test_falls_back_for_day_components(self):
+        _make_client()
+        from src.api.youtube_client import _parse_iso_duration
+
+        assert _parse_iso_duration("P1DT2H3M") == 93780
+        assert _parse_iso_duration("P0D") == 0